@@ -13,6 +13,7 @@ import time
 import websocket
 import threading
 import requests
+from requests.adapters import HTTPAdapter
 import importlib.util
 import signal
 import atexit
@@ -134,6 +135,11 @@ class WARPClient:
         verify_ssl = self.config.get('security.certificate_validation', True)
         self.session.verify = verify_ssl
         
+        # Keep connections alive across repeated requests and connection tests
+        adapter = HTTPAdapter(pool_connections=16, pool_maxsize=16)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        
         # Configure proxy if enabled
         if self.config.get('security.proxy_support'):
             proxy_config = self.config.get('security.proxy_config', {})
@@ -21,6 +21,10 @@ sys.path.append(str(Path(__file__).parent.parent / 'src'))
 from config_manager import config_manager
 from warp_client import warp_client
 
+LOG_MAX_LINES = 1000
+LOG_TRIM_CHUNK = 100
+STATUS_INTERVAL_MS = 5000
+
 class ConfigEditor(QDialog):
     def __init__(self, parent=None):
         super().__init__(parent)
@@ -737,12 +741,32 @@ class TokenDialog(QDialog):
             {'description': self.description_field.toPlainText()}
         )
 
+class _StatusWorker(QObject):
+    """Fetches client status off the GUI thread"""
+    poll_requested = pyqtSignal()
+    status_ready = pyqtSignal(dict)
+    
+    def __init__(self):
+        super().__init__()
+        self.poll_requested.connect(self.poll)
+    
+    def poll(self):
+        try:
+            status = warp_client.get_status()
+        except Exception as e:
+            logging.warning(f"Could not fetch client status: {e}")
+            status = {}
+        self.status_ready.emit(status)
+
 class WarpLauncher(QMainWindow):
     def __init__(self):
         super().__init__()
         self.setWindowTitle("Mini WARP Client Launcher")
         self.setGeometry(100, 100, 1000, 700)
         
+        # Rendered status sections, keyed on their source data
+        self._sec_cache = {}
+        
         # Apply theme
         self.applyTheme()
         
@@ -897,6 +921,7 @@ class WarpLauncher(QMainWindow):
         
         # Tabs for different views
         tabs = QTabWidget()
+        self.right_tabs = tabs
         
         # Status tab
         status_widget = QWidget()
@@ -935,6 +960,9 @@ class WarpLauncher(QMainWindow):
         metrics_widget.setLayout(metrics_layout)
         tabs.addTab(metrics_widget, "Metrics")
         
+        # Refresh the newly visible tab; hidden tabs are skipped in updateStatus
+        tabs.currentChanged.connect(lambda _index: self.updateStatus())
+        
         right_layout.addWidget(tabs)
         content_layout.addWidget(right_panel)
         
@@ -946,10 +974,18 @@ class WarpLauncher(QMainWindow):
             self.status_bar.showMessage("Ready")
     
     def setupStatusUpdates(self):
+        # Worker thread for fetching status without blocking the GUI
+        self._status_pending = False
+        self.status_thread = QThread(self)
+        self.status_worker = _StatusWorker()
+        self.status_worker.moveToThread(self.status_thread)
+        self.status_worker.status_ready.connect(self._applyStatus, Qt.QueuedConnection)
+        self.status_thread.start()
+        
         # Timer for updating status
         self.status_timer = QTimer()
         self.status_timer.timeout.connect(self.updateStatus)
-        self.status_timer.start(5000)  # Update every 5 seconds
+        self.status_timer.start(STATUS_INTERVAL_MS)  # Update every 5 seconds
         
         # Setup event callbacks
         warp_client.add_event_callback('connected', self.onConnected)
@@ -957,8 +993,44 @@ class WarpLauncher(QMainWindow):
         warp_client.add_event_callback('authenticated', self.onAuthenticated)
         warp_client.add_event_callback('command_executed', self.onCommandExecuted)
     
+    def resumeStatusUpdates(self):
+        if not self.status_timer.isActive():
+            self.status_timer.start(STATUS_INTERVAL_MS)
+            self.updateStatus()
+    
+    def showEvent(self, event):
+        super().showEvent(event)
+        self.resumeStatusUpdates()
+    
+    def hideEvent(self, event):
+        super().hideEvent(event)
+        self.status_timer.stop()
+    
+    def changeEvent(self, event):
+        super().changeEvent(event)
+        if event.type() == QEvent.WindowStateChange:
+            if self.isMinimized():
+                self.status_timer.stop()
+            elif self.isVisible():
+                self.resumeStatusUpdates()
+    
+    def closeEvent(self, event):
+        self.status_timer.stop()
+        self.status_thread.quit()
+        self.status_thread.wait()
+        super().closeEvent(event)
+    
     def updateStatus(self):
-        status = warp_client.get_status()
+        # Coalesce ticks while a request is still in flight
+        if self._status_pending:
+            return
+        self._status_pending = True
+        self.status_worker.poll_requested.emit()
+    
+    def _applyStatus(self, status):
+        self._status_pending = False
+        if not status:
+            return
         
         # Update connection status
         if status['connection']['connected']:
@@ -970,7 +1042,36 @@ class WarpLauncher(QMainWindow):
             self.status_label.setStyleSheet("color: red; font-weight: bold;")
             self.connect_btn.setText("Connect")
         
+        current_tab = self.right_tabs.currentWidget()
+        
         # Update status text
+        if current_tab is self.status_text.parentWidget():
+            self.updateStatusText(status)
+        
+        # Update metrics
+        if current_tab is self.metrics_text.parentWidget():
+            self.updateMetricsText(status)
+        
+        # Update status bar
+        if hasattr(self, 'status_bar'):
+            self.status_bar.showMessage(f"Status: {'Connected' if status['connection']['connected'] else 'Disconnected'} | "
+                                      f"Requests: {status['metrics']['total_requests']} | "
+                                      f"Success: {status['metrics']['success_rate']:.1f}%")
+    
+    def updateStatusText(self, status):
+        # Feature/endpoint/token lists rarely change; reuse the rendered text
+        key = (tuple(status['features'].items()), tuple(status['endpoints'].items()), tuple(status['tokens']))
+        if key != self._sec_cache.get('key'):
+            self._sec_cache = {
+                'key': key,
+                'rendered': (
+                    chr(10).join(f"- {feature}: {'Yes' if enabled else 'No'}" for feature, enabled in status['features'].items()),
+                    chr(10).join(f"- {name}: {url}" for name, url in status['endpoints'].items()),
+                    ', '.join(status['tokens']) if status['tokens'] else 'None'
+                )
+            }
+        features_text, endpoints_text, tokens_text = self._sec_cache['rendered']
+        
         status_info = f"""
 Connection Status: {'Connected' if status['connection']['connected'] else 'Disconnected'}
 Authentication: {'Authenticated' if status['connection']['authenticated'] else 'Not Authenticated'}
@@ -981,16 +1082,16 @@ Average Response Time: {status['metrics']['avg_response_time']:.3f}s
 Bandwidth Used: {status['metrics']['bandwidth_used']} bytes
 
 Enabled Features:
-{chr(10).join(f"- {feature}: {'Yes' if enabled else 'No'}" for feature, enabled in status['features'].items())}
+{features_text}
 
 Configured Endpoints:
-{chr(10).join(f"- {name}: {url}" for name, url in status['endpoints'].items())}
+{endpoints_text}
 
-Available Tokens: {', '.join(status['tokens']) if status['tokens'] else 'None'}
+Available Tokens: {tokens_text}
         """
         self.status_text.setPlainText(status_info.strip())
-        
-        # Update metrics
+    
+    def updateMetricsText(self, status):
         metrics_info = f"""
 Request Metrics:
 - Total Requests: {status['metrics']['total_requests']}
@@ -1008,12 +1109,6 @@ Connection Metrics:
 Loaded Modules: {', '.join(status['modules']) if status['modules'] else 'None'}
         """
         self.metrics_text.setPlainText(metrics_info.strip())
-        
-        # Update status bar
-        if hasattr(self, 'status_bar'):
-            self.status_bar.showMessage(f"Status: {'Connected' if status['connection']['connected'] else 'Disconnected'} | "
-                                      f"Requests: {status['metrics']['total_requests']} | "
-                                      f"Success: {status['metrics']['success_rate']:.1f}%")
     
     def formatBytes(self, bytes_value):
         """Format bytes in human readable format"""
@@ -1036,16 +1131,15 @@ Loaded Modules: {', '.join(status['modules']) if status['modules'] else 'None'}
         self.appendLog(f"Command executed: {data.get('command', 'Unknown')} (Exit code: {data.get('exit_code', 'Unknown')})")
     
     def appendLog(self, message):
-        from datetime import datetime
         current_time = datetime.now().strftime("%H:%M:%S")
         log_entry = f"[{current_time}] {message}\n"
         self.logs_text.append(log_entry.strip())
         
         # Limit log size
-        if self.logs_text.document().lineCount() > 1000:
+        if self.logs_text.document().blockCount() > LOG_MAX_LINES:
             cursor = self.logs_text.textCursor()
             cursor.movePosition(QTextCursor.Start)
-            cursor.movePosition(QTextCursor.Down, QTextCursor.KeepAnchor, 100)
+            cursor.movePosition(QTextCursor.NextBlock, QTextCursor.KeepAnchor, LOG_TRIM_CHUNK)
             cursor.removeSelectedText()
     
     def openConfigEditor(self):
@@ -1098,7 +1192,7 @@ Loaded Modules: {', '.join(status['modules']) if status['modules'] else 'None'}
         results = []
         for name, url in endpoints.items():
             try:
-                response = warp_client.session.get(url, timeout=5)
+                response = warp_client.session.head(url, timeout=5, allow_redirects=True)
                 status = f"✓ {name}: {response.status_code}"
                 results.append(status)
             except Exception as e:
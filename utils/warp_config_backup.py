@@ -10,6 +10,12 @@ from datetime import datetime
 from pathlib import Path
 import argparse
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 class WarpConfigBackup:
     def __init__(self, config_dir="./config", data_dir="./data", backup_dir="./backups"):
         self.config_dir = Path(config_dir)
@@ -118,8 +124,8 @@ class WarpConfigBackup:
         # Load and sanitize configuration
         config_file = self.config_dir / "default_config.json"
         if config_file.exists():
-            with open(config_file, 'r') as f:
-                config = json.load(f)
+            raw = config_file.read_bytes()
+            config = orjson.loads(raw) if ORJSON_AVAILABLE else json.loads(raw)
             
             # Remove sensitive sections
             if 'authentication' in config:
@@ -128,11 +134,6 @@ class WarpConfigBackup:
                     'auto_refresh': config['authentication'].get('auto_refresh', True)
                 }
             
-            if 'security' in config:
-                # Keep security settings but remove actual credentials
-                security = config['security'].copy()
-                config['security'] = security
-            
             # Add export metadata
             export_data = {
                 'exported_at': datetime.now().isoformat(),
@@ -141,8 +142,10 @@ class WarpConfigBackup:
                 'configuration': config
             }
             
-            with open(export_path, 'w') as f:
-                json.dump(export_data, f, indent=2)
+            if ORJSON_AVAILABLE:
+                export_path.write_bytes(orjson.dumps(export_data, option=orjson.OPT_INDENT_2))
+            else:
+                export_path.write_text(json.dumps(export_data, indent=2))
             
             print(f"✅ Configuration exported to: {export_path}")
         else:
@@ -16,7 +16,7 @@ import requests
 import base64
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Dict, List, Optional, Set, Union
+from typing import Dict, List, Optional, Set, Tuple, Union
 import threading
 import webbrowser
 from dataclasses import dataclass, asdict
@@ -355,8 +355,8 @@ class WARPManagerEnhanced:
         else:
             return {}
     
-    def backup_with_sync(self, types: List[str], upload_to_github: bool = False) -> Optional[Path]:
-        """Create backup and optionally sync to GitHub"""
+    def backup_with_sync(self, types: List[str], upload_to_github: bool = False) -> Tuple[Optional[Path], Optional[bool]]:
+        """Create backup and optionally sync to GitHub; returns (path, uploaded or None if not attempted)"""
         backup_path = self.backup_selective(types)
         
         if backup_path and upload_to_github and self.github.test_connection():
@@ -364,11 +364,12 @@ class WARPManagerEnhanced:
             result = self.github.upload_backup(backup_path)
             if result:
                 print("✅ Backup uploaded to GitHub successfully")
-                return backup_path
+                return backup_path, True
             else:
                 print("❌ GitHub upload failed")
+                return backup_path, False
         
-        return backup_path
+        return backup_path, None
     
     def backup_selective(self, types: List[str]) -> Optional[Path]:
         """Create selective backup (same as base class but with enhanced manifest)"""
@@ -531,6 +532,10 @@ class WARPManagerEnhanced:
             return []
         return sorted([f for f in self.backup_dir.iterdir() if f.suffix == '.zst'])
 
+def run_backup(types: List[str], upload: bool = False) -> Tuple[Optional[Path], Optional[bool]]:
+    """Create a selective backup, optionally uploading it (entry point for in-process callers)"""
+    return WARPManagerEnhanced().backup_with_sync(types, upload)
+
 def main():
     """Enhanced main function with GitHub and scheduler options"""
     import argparse
@@ -603,14 +608,14 @@ def main():
     # Handle regular backup commands
     if args.cli or any([args.snapshot, args.backup, args.list]):
         if args.snapshot:
-            backup_path = manager.backup_with_sync(
+            backup_path, _ = manager.backup_with_sync(
                 ["rules", "mcp", "database", "preferences", "logs", "profiles"],
                 args.upload
             )
             print(f"Snapshot: {backup_path}")
             
         elif args.backup:
-            backup_path = manager.backup_with_sync(args.backup, args.upload)
+            backup_path, _ = manager.backup_with_sync(args.backup, args.upload)
             print(f"Backup: {backup_path}")
             
         elif args.list:
@@ -7,19 +7,98 @@ Supports Windows, Linux, macOS with automatic platform detection
 import sys
 import os
 import platform
-import subprocess
-import argparse
 import json
+import time
 from pathlib import Path
-import shutil
+import functools
+import hashlib
+from importlib.util import find_spec
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Python dependencies (cross-platform)
+PYTHON_DEPS = [
+    "PyQt5",
+    "zstandard",
+    "requests",
+    "psutil",
+    "cryptography"
+]
+
+# Platform-specific pip packages
+PLATFORM_PIP_DEPS = {
+    "windows": ["pywin32", "wmi"],
+    "darwin": ["pyobjc-framework-Cocoa"]
+}
+
+def _missing(pkgs):
+    """Return the packages from pkgs that are not installed in this interpreter"""
+    from importlib.metadata import version, PackageNotFoundError
+    
+    out = []
+    for p in pkgs:
+        try:
+            version(p.split('[')[0])
+        except PackageNotFoundError:
+            out.append(p)
+    return out
+
+def _json_dumps(obj):
+    """Serialize obj as indented JSON bytes, using orjson when available"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2).encode()
+
+def _json_loads(data):
+    """Parse JSON bytes, using orjson when available"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+def _noop(launcher):
+    """Fallback for platforms without a specific install/setup step (nothing to fail)"""
+    return True
+
+def _write_if_changed(path, content):
+    """Write content to path unless it already holds exactly that; return True if written"""
+    try:
+        if path.read_text() == content:
+            return False
+    except (FileNotFoundError, UnicodeDecodeError):
+        pass
+    path.write_text(content)
+    return True
+
+@functools.lru_cache(maxsize=1)
+def _path_executables():
+    """Names of all entries in PATH directories, gathered in one pass"""
+    execs = set()
+    for d in os.environ.get("PATH", "").split(os.pathsep):
+        try:
+            execs.update(os.listdir(d))
+        except OSError:
+            pass
+    return execs
 
 class WARPUniversalLauncher:
     def __init__(self):
         self.system = platform.system().lower()
         self.base_dir = Path(__file__).parent
         self.config_file = self.base_dir / "launcher_config.json"
-        self.load_config()
-        
+        self._env_info = None
+        self._config = None
+    
+    @property
+    def config(self):
+        """Launcher configuration, loaded from disk on first access"""
+        if self._config is None:
+            self.load_config()
+        return self._config
+    
     def load_config(self):
         """Load or create launcher configuration"""
         default_config = {
@@ -32,19 +111,23 @@ class WARPUniversalLauncher:
         }
         
         if self.config_file.exists():
-            with open(self.config_file, 'r') as f:
-                self.config = json.load(f)
+            self._config = _json_loads(self.config_file.read_bytes())
         else:
-            self.config = default_config
+            self._config = default_config
             self.save_config()
     
     def save_config(self):
         """Save configuration to file"""
-        with open(self.config_file, 'w') as f:
-            json.dump(self.config, f, indent=2)
+        self.config_file.write_bytes(_json_dumps(self.config))
     
     def detect_environment(self):
-        """Detect system environment and capabilities"""
+        """Detect system environment and capabilities (cached after first call)"""
+        if self._env_info is None:
+            self._env_info = self._compute_env()
+        return self._env_info
+    
+    def _compute_env(self):
+        """Probe platform, GUI and package manager information"""
         env_info = {
             "system": self.system,
             "python_version": sys.version,
@@ -58,103 +141,142 @@ class WARPUniversalLauncher:
         if self.system == "linux":
             env_info["has_gui"] = bool(os.environ.get("DISPLAY"))
             # Detect package manager
-            if shutil.which("apt"):
+            bins = _path_executables()
+            if "apt" in bins:
                 env_info["package_manager"] = "apt"
-            elif shutil.which("yum"):
+            elif "yum" in bins:
                 env_info["package_manager"] = "yum"
-            elif shutil.which("pacman"):
+            elif "pacman" in bins:
                 env_info["package_manager"] = "pacman"
         elif self.system == "windows":
             env_info["has_gui"] = True
             env_info["package_manager"] = "pip"
         elif self.system == "darwin":
             env_info["has_gui"] = True
-            env_info["package_manager"] = "brew" if shutil.which("brew") else "pip"
+            env_info["package_manager"] = "brew" if "brew" in _path_executables() else "pip"
         
         return env_info
     
     def install_dependencies(self):
-        """Install platform-specific dependencies"""
+        """Install platform-specific dependencies; return True if everything succeeded"""
         print(f"🔧 Installing dependencies for {self.system}...")
         
-        # Python dependencies (cross-platform)
-        python_deps = [
-            "PyQt5",
-            "zstandard",
-            "requests",
-            "psutil",
-            "cryptography"
-        ]
+        python_deps = PYTHON_DEPS
+        platform_deps = PLATFORM_PIP_DEPS.get(self.system, [])
         
-        for dep in python_deps:
-            print(f"  📦 Installing {dep}...")
-            try:
-                subprocess.run([sys.executable, "-m", "pip", "install", dep], 
-                             check=True, capture_output=True)
-                print(f"  ✅ {dep} installed")
-            except subprocess.CalledProcessError as e:
-                print(f"  ⚠️ Failed to install {dep}: {e}")
+        # Skip everything if this interpreter already has the full set
+        fingerprint = f"{sys.executable}|{sys.version}|{','.join(python_deps)}|{','.join(platform_deps)}"
+        if self.config.get("installed_deps_fingerprint") == fingerprint:
+            print("  ✅ Dependencies already installed")
+            return True
+        
+        ok = self._pip_install(python_deps)
         
         # Platform-specific dependencies
-        if self.system == "linux":
-            self._install_linux_deps()
-        elif self.system == "windows":
-            self._install_windows_deps()
-        elif self.system == "darwin":
-            self._install_macos_deps()
+        ok = self._INSTALL.get(self.system, _noop)(self) and ok
+        
+        # Only remember the install once nothing is missing, so failed steps are retried
+        if ok and not _missing(python_deps + platform_deps):
+            self.config["installed_deps_fingerprint"] = fingerprint
+            self.save_config()
+            return True
+        return False
+    
+    def _run_pip(self, cmd):
+        """Run a pip command discarding stdout; return (returncode, tail of stderr)"""
+        import subprocess
+        
+        proc = subprocess.Popen(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True)
+        _, err = proc.communicate()
+        return proc.returncode, err[-500:]
+    
+    def _pip_install(self, packages):
+        """Install packages with a single pip call, retrying one by one on failure; return True if all installed"""
+        packages = _missing(packages)
+        if not packages:
+            print("  ✅ All packages already installed")
+            return True
+        
+        print(f"  📦 Installing {', '.join(packages)}...")
+        
+        # Persistent wheel cache shared by every setup run
+        cache_dir = Path.home() / ".warp-backups" / "pip-cache"
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        pip_cmd = [sys.executable, "-m", "pip", "install", "--disable-pip-version-check",
+                   "--cache-dir", str(cache_dir), "--prefer-binary"]
+        
+        returncode, _ = self._run_pip(pip_cmd + packages)
+        if returncode == 0:
+            for dep in packages:
+                print(f"  ✅ {dep} installed")
+            return True
+        
+        # Batch failed - isolate the packages that cannot be installed. These run one
+        # at a time: pip does not lock site-packages or its cache dir, so concurrent
+        # installs sharing dependencies could leave partial files or broken dist-info.
+        results = [(dep, *self._run_pip(pip_cmd + [dep])) for dep in packages]
+        
+        ok = True
+        for dep, returncode, error in results:
+            if returncode == 0:
+                print(f"  ✅ {dep} installed")
+            else:
+                ok = False
+                lines = error.strip().splitlines()
+                print(f"  ⚠️ Failed to install {dep}: {lines[-1] if lines else 'pip error'}")
+        return ok
     
     def _install_linux_deps(self):
-        """Install Linux-specific dependencies"""
+        """Install Linux-specific dependencies; return False if apt failed"""
+        import subprocess
+        
         print("🐧 Installing Linux system dependencies...")
         
         # Try to install system packages if we have permission
         if os.geteuid() == 0:  # Running as root
+            apt_env = {**os.environ, "DEBIAN_FRONTEND": "noninteractive"}
             try:
-                subprocess.run(["apt", "update"], check=True, capture_output=True)
-                subprocess.run(["apt", "install", "-y", "python3-pyqt5", "git"], 
-                             check=True, capture_output=True)
+                # Reuse apt's package index if it was refreshed within the last day
+                pkg_cache = Path("/var/cache/apt/pkgcache.bin")
+                if not pkg_cache.exists() or time.time() - pkg_cache.stat().st_mtime > 86400:
+                    subprocess.run(["apt-get", "update", "-qq"], env=apt_env, check=True, capture_output=True)
+                subprocess.run(["apt-get", "install", "-y", "--no-install-recommends", "python3-pyqt5", "git"], 
+                             env=apt_env, check=True, capture_output=True)
                 print("  ✅ System packages installed")
             except:
                 print("  ⚠️ System package installation failed (non-critical)")
+                return False
+        return True
     
     def _install_windows_deps(self):
         """Install Windows-specific dependencies"""
         print("🪟 Installing Windows dependencies...")
         
         # Windows-specific packages
-        windows_deps = ["pywin32", "wmi"]
-        for dep in windows_deps:
-            try:
-                subprocess.run([sys.executable, "-m", "pip", "install", dep], 
-                             check=True, capture_output=True)
-                print(f"  ✅ {dep} installed")
-            except:
-                print(f"  ⚠️ {dep} installation failed")
+        return self._pip_install(PLATFORM_PIP_DEPS["windows"])
     
     def _install_macos_deps(self):
         """Install macOS-specific dependencies"""
         print("🍎 Installing macOS dependencies...")
         
         # macOS-specific packages
-        macos_deps = ["pyobjc-framework-Cocoa"]
-        for dep in macos_deps:
-            try:
-                subprocess.run([sys.executable, "-m", "pip", "install", dep], 
-                             check=True, capture_output=True)
-                print(f"  ✅ {dep} installed")
-            except:
-                print(f"  ⚠️ {dep} installation failed")
+        return self._pip_install(PLATFORM_PIP_DEPS["darwin"])
+    
+    _INSTALL = {
+        "linux": _install_linux_deps,
+        "windows": _install_windows_deps,
+        "darwin": _install_macos_deps
+    }
     
     def setup_desktop_integration(self):
-        """Setup desktop integration for current platform"""
+        """Setup desktop integration for current platform; return True on success"""
         print(f"🖥️ Setting up desktop integration for {self.system}...")
         
-        if self.system == "linux":
-            self._setup_linux_desktop()
-        elif self.system == "windows":
-            self._setup_windows_desktop()
-        elif self.system == "darwin":
-            self._setup_macos_desktop()
+        try:
+            return self._DESKTOP.get(self.system, _noop)(self)
+        except OSError as e:
+            print(f"  ⚠️ Desktop integration failed: {e}")
+            return False
     
     def _setup_linux_desktop(self):
         """Setup Linux desktop integration"""
@@ -173,11 +295,12 @@ Categories=Network;Development;Utility;
 StartupNotify=true"""
         
         desktop_file = desktop_dir / "warp-terminal.desktop"
-        with open(desktop_file, 'w') as f:
-            f.write(desktop_content)
-        
-        os.chmod(desktop_file, 0o755)
-        print("  ✅ Linux desktop entry created")
+        if _write_if_changed(desktop_file, desktop_content):
+            os.chmod(desktop_file, 0o755)
+            print("  ✅ Linux desktop entry created")
+        else:
+            print("  ✅ Linux desktop entry up to date")
+        return True
     
     def _setup_windows_desktop(self):
         """Setup Windows desktop integration"""
@@ -197,13 +320,15 @@ cd /d "{self.base_dir}"
 python warp_launcher.py %*
 pause"""
             
-            with open(self.base_dir / "warp-terminal.bat", 'w') as f:
-                f.write(batch_content)
-            
-            print("  ✅ Windows batch launcher created")
+            if _write_if_changed(self.base_dir / "warp-terminal.bat", batch_content):
+                print("  ✅ Windows batch launcher created")
+            else:
+                print("  ✅ Windows batch launcher up to date")
+            return True
             
         except ImportError:
             print("  ⚠️ Windows registry integration requires winreg module")
+            return False
     
     def _setup_macos_desktop(self):
         """Setup macOS desktop integration"""
@@ -232,8 +357,7 @@ pause"""
 </dict>
 </plist>"""
         
-        with open(contents_dir / "Info.plist", 'w') as f:
-            f.write(plist_content)
+        plist_written = _write_if_changed(contents_dir / "Info.plist", plist_content)
         
         # Create executable script
         exec_script = f"""#!/bin/bash
@@ -241,11 +365,43 @@ cd "{self.base_dir}"
 python3 warp_launcher.py gui"""
         
         exec_file = macos_dir / "warp-terminal"
-        with open(exec_file, 'w') as f:
-            f.write(exec_script)
+        if _write_if_changed(exec_file, exec_script):
+            os.chmod(exec_file, 0o755)
+        elif not plist_written:
+            print("  ✅ macOS .app bundle up to date")
+            return True
         
-        os.chmod(exec_file, 0o755)
         print("  ✅ macOS .app bundle created")
+        return True
+    
+    _DESKTOP = {
+        "linux": _setup_linux_desktop,
+        "windows": _setup_windows_desktop,
+        "darwin": _setup_macos_desktop
+    }
+    
+    def _run_script(self, script, *args):
+        """Run a sibling script as __main__ in this interpreter, returning its exit code"""
+        import runpy
+        
+        saved_argv = sys.argv
+        sys.argv = [str(script), *args]
+        try:
+            runpy.run_path(str(script), run_name="__main__")
+        except SystemExit as e:
+            if e.code is None or isinstance(e.code, int):
+                return e.code or 0
+            print(e.code, file=sys.stderr)
+            return 1
+        finally:
+            sys.argv = saved_argv
+        return 0
+    
+    def _report_exit(self, name, code):
+        """Warn about a non-zero script exit code and pass it through"""
+        if code:
+            print(f"⚠️ {name} exited with code {code}")
+        return code
     
     def launch_gui(self):
         """Launch GUI application"""
@@ -256,31 +412,42 @@ python3 warp_launcher.py gui"""
             print("⚠️ No GUI environment detected, falling back to CLI mode")
             return self.launch_cli()
         
-        try:
-            if self.config.get("backup_before_launch", False):
+        # The optional pre-launch backup must never prevent the launch
+        if self.config.get("backup_before_launch", False):
+            try:
                 self.create_backup()
-            
-            subprocess.run([sys.executable, str(self.base_dir / "warp_suite_manager.py")])
-        except FileNotFoundError:
-            print("❌ GUI launcher not found, trying unified launcher...")
-            subprocess.run([sys.executable, str(self.base_dir / "warp_unified_launcher.py"), "client-gui"])
+            except Exception as e:
+                print(f"⚠️ Pre-launch backup failed: {e}")
+        
+        gui_script = self.base_dir / "warp_suite_manager.py"
+        if gui_script.is_file():
+            return self._report_exit("GUI", self._run_script(gui_script))
+        
+        print("❌ GUI launcher not found, trying unified launcher...")
+        unified = self.base_dir / "warp_unified_launcher.py"
+        if not unified.is_file():
+            print("❌ Unified launcher not found")
+            return 1
+        return self._report_exit("Unified launcher", self._run_script(unified, "client-gui"))
     
     def launch_cli(self):
         """Launch CLI application"""
         print("💻 Launching WARP Terminal CLI...")
         
-        try:
-            subprocess.run([sys.executable, str(self.base_dir / "warp_unified_launcher.py"), "client-cli"])
-        except FileNotFoundError:
+        unified = self.base_dir / "warp_unified_launcher.py"
+        if not unified.is_file():
             print("❌ CLI launcher not found")
+            return 1
+        return self._report_exit("CLI", self._run_script(unified, "client-cli"))
     
     def create_backup(self):
         """Create system backup"""
         print("💾 Creating backup...")
-        try:
-            subprocess.run([sys.executable, str(self.base_dir / "warp-manager-enhanced.py"), "--snapshot"])
-        except FileNotFoundError:
+        backup_script = self.base_dir / "warp-manager-enhanced.py"
+        if not backup_script.is_file():
             print("⚠️ Backup system not available")
+            return 1
+        return self._report_exit("Backup", self._run_script(backup_script, "--snapshot"))
     
     def show_status(self):
         """Show system status dashboard"""
@@ -301,21 +468,25 @@ python3 warp_launcher.py gui"""
             ("warp-manager-enhanced.py", "Backup System")
         ]
         
+        # One directory read instead of a stat per component
+        try:
+            with os.scandir(self.base_dir) as entries:
+                present = {entry.name for entry in entries}
+        except OSError:
+            present = set()
+        
         print("\n📋 Components:")
         for filename, name in components:
-            file_path = self.base_dir / filename
-            status = "✅" if file_path.exists() else "❌"
+            status = "✅" if filename in present else "❌"
             print(f"  {status} {name}")
         
         # Check dependencies
         print("\n📦 Dependencies:")
         deps_to_check = ["PyQt5", "zstandard", "requests"]
         for dep in deps_to_check:
-            try:
-                __import__(dep.lower().replace("pyqt5", "PyQt5.QtWidgets"))
-                print(f"  ✅ {dep}")
-            except ImportError:
-                print(f"  ❌ {dep}")
+            # Locate the package without importing it (PyQt5 import is expensive)
+            ok = find_spec(dep) is not None
+            print(f"  {'✅' if ok else '❌'} {dep}")
     
     def configure(self):
         """Interactive configuration"""
@@ -357,31 +528,65 @@ python3 warp_launcher.py gui"""
                 print("Invalid option")
     
     def setup_complete(self):
-        """Complete setup process"""
+        """Complete setup process; return True if every step succeeded"""
         print("🚀 WARP Terminal Complete Setup")
         print("=" * 35)
         
+        # Skip the whole setup when nothing relevant changed since the last run
+        backup_dir = Path.home() / ".warp-backups"
+        setup_marker = backup_dir / ".setup_done"
+        fingerprint = hashlib.sha256((
+            self.system
+            + json.dumps(sorted(PYTHON_DEPS))
+            + json.dumps([self.config.get("auto_install_deps", True), self.config.get("desktop_integration", True)])
+            + str(Path(__file__).stat().st_mtime)
+        ).encode()).hexdigest()
+        try:
+            if setup_marker.read_text().strip() == fingerprint:
+                print("✅ WARP Terminal is already set up")
+                return True
+        except OSError:
+            pass
+        
         env_info = self.detect_environment()
         print(f"Platform detected: {env_info['system'].title()}")
         
+        ok = True
         if self.config.get("auto_install_deps", True):
-            self.install_dependencies()
+            ok = self.install_dependencies() and ok
         
         if self.config.get("desktop_integration", True):
-            self.setup_desktop_integration()
+            ok = self.setup_desktop_integration() and ok
+        
+        # Only mark setup as done when every step worked, so failures are retried
+        if not ok:
+            print("⚠️ Setup finished with errors - run setup again to retry")
+            return False
         
-        # Create initial backup
-        backup_dir = Path.home() / ".warp-backups"
         backup_dir.mkdir(exist_ok=True)
+        setup_marker.write_text(fingerprint)
         
         print("✅ Setup completed successfully!")
         print("\n🎯 Quick start commands:")
         print(f"  python {Path(__file__).name} gui     # Launch GUI")
         print(f"  python {Path(__file__).name} cli     # Launch CLI")
         print(f"  python {Path(__file__).name} status  # Show status")
+        return True
 
-def main():
-    launcher = WARPUniversalLauncher()
+# Command name -> launcher method
+COMMANDS = {
+    'gui': 'launch_gui',
+    'cli': 'launch_cli',
+    'backup': 'create_backup',
+    'status': 'show_status',
+    'config': 'configure',
+    'setup': 'setup_complete',
+    'install': 'install_dependencies'
+}
+
+def parse_args():
+    """Full argparse parsing, only used for --help and invalid arguments"""
+    import argparse
     
     parser = argparse.ArgumentParser(
         description="WARP Terminal Universal Cross-Platform Launcher",
@@ -398,26 +603,29 @@ Available commands:
     )
     
     parser.add_argument('command', nargs='?', default='gui',
-                       choices=['gui', 'cli', 'backup', 'status', 'config', 'setup', 'install'],
+                       choices=list(COMMANDS),
                        help='Command to execute')
     
-    args = parser.parse_args()
+    return parser.parse_args()
+
+def main():
+    # Fast path: a single known command (or none) needs no argparse
+    argv = sys.argv[1:]
+    if not argv:
+        command = 'gui'
+    elif len(argv) == 1 and argv[0] in COMMANDS:
+        command = argv[0]
+    else:
+        command = parse_args().command
+    
+    launcher = WARPUniversalLauncher()
     
     try:
-        if args.command == 'gui':
-            launcher.launch_gui()
-        elif args.command == 'cli':
-            launcher.launch_cli()
-        elif args.command == 'backup':
-            launcher.create_backup()
-        elif args.command == 'status':
-            launcher.show_status()
-        elif args.command == 'config':
-            launcher.configure()
-        elif args.command == 'setup':
-            launcher.setup_complete()
-        elif args.command == 'install':
-            launcher.install_dependencies()
+        result = getattr(launcher, COMMANDS[command])()
+        
+        # gui/cli/backup return the exit code of the script they ran
+        if command in ("gui", "cli", "backup") and result:
+            sys.exit(result)
         
     except KeyboardInterrupt:
         print("\n👋 Goodbye!")
@@ -8,26 +8,137 @@ import os
 import sys
 import time
 import json
+import socket
+import struct
 import psutil
 import threading
 import subprocess
 import signal
+import sched
 import logging
+import logging.handlers
+import importlib.util
 from datetime import datetime, timedelta
 from pathlib import Path
+from collections import deque
 from typing import Dict, List, Optional, Set
 
-# Configure logging
+def _is_devnull(stream) -> bool:
+    """True if stream is missing or redirected to the null device (detached daemon)"""
+    if stream is None:
+        return True
+    try:
+        st = os.fstat(stream.fileno())
+        null = os.stat(os.devnull)
+    except (AttributeError, OSError, ValueError):
+        return False
+    return (st.st_dev, st.st_ino) == (null.st_dev, null.st_ino)
+
+# Configure logging: bounded log file, console output only when someone can see it
+_log_handlers = [
+    logging.handlers.RotatingFileHandler(Path.home() / '.warp-monitor.log',
+                                         maxBytes=1_000_000, backupCount=3, delay=True)
+]
+if not _is_devnull(sys.stderr):
+    _log_handlers.append(logging.StreamHandler())
+
 logging.basicConfig(
     level=logging.INFO,
     format='%(asctime)s [%(levelname)s] %(message)s',
-    handlers=[
-        logging.FileHandler(Path.home() / '.warp-monitor.log'),
-        logging.StreamHandler()
-    ]
+    handlers=_log_handlers
 )
 logger = logging.getLogger(__name__)
 
+IS_LINUX = sys.platform.startswith("linux")
+
+# How long is_running()/get_running_pid() results are reused
+STATUS_CACHE_TTL = 2.0
+
+# Longest an automated backup may run before it is reported as timed out
+BACKUP_TIMEOUT = 600
+
+# Linux process connector (see linux/connector.h and linux/cn_proc.h)
+NETLINK_CONNECTOR = 11
+CN_IDX_PROC = 1
+CN_VAL_PROC = 1
+NLMSG_DONE = 3
+PROC_CN_MCAST_LISTEN = 1
+PROC_EVENT_EXEC = 0x00000002
+NLMSG_HDR = struct.Struct("=IHHII")
+CN_MSG_HDR = struct.Struct("=IIIIHH")
+PROC_EVENT_HDR = struct.Struct("=IIQ")
+
+class ProcExecListener(threading.Thread):
+    """Wakes the monitor when a process whose name matches is exec'd (Linux, needs CAP_NET_ADMIN)"""
+    
+    def __init__(self, names_lower, wake_event: threading.Event):
+        super().__init__(name="proc-exec-listener", daemon=True)
+        self.names_lower = names_lower
+        self.wake_event = wake_event
+        self.sock = None
+    
+    def open(self) -> bool:
+        """Subscribe to process events; returns False if the kernel refuses"""
+        if not IS_LINUX:
+            return False
+        try:
+            self.sock = socket.socket(socket.AF_NETLINK, socket.SOCK_DGRAM, NETLINK_CONNECTOR)
+            self.sock.bind((os.getpid(), CN_IDX_PROC))
+            op = struct.pack("=I", PROC_CN_MCAST_LISTEN)
+            cn_msg = CN_MSG_HDR.pack(CN_IDX_PROC, CN_VAL_PROC, 0, 0, len(op), 0) + op
+            self.sock.send(NLMSG_HDR.pack(NLMSG_HDR.size + len(cn_msg), NLMSG_DONE, 0, 0, os.getpid()) + cn_msg)
+            return True
+        except (OSError, AttributeError) as e:
+            logger.debug(f"Process event socket unavailable, using polling only: {e}")
+            if self.sock:
+                self.sock.close()
+                self.sock = None
+            return False
+    
+    def run(self):
+        event_offset = NLMSG_HDR.size + CN_MSG_HDR.size
+        pid_offset = event_offset + PROC_EVENT_HDR.size
+        while True:
+            try:
+                data = self.sock.recv(4096)
+            except OSError:
+                return
+            if len(data) < pid_offset + 8:
+                continue
+            what = PROC_EVENT_HDR.unpack_from(data, event_offset)[0]
+            if what != PROC_EVENT_EXEC:
+                continue
+            pid = struct.unpack_from("=I", data, pid_offset)[0]
+            try:
+                with open(f"/proc/{pid}/comm") as f:
+                    comm = f.read().strip().lower()
+            except OSError:
+                continue
+            if any(n in comm for n in self.names_lower):
+                logger.debug(f"WARP process exec'd: PID {pid} ({comm})")
+                self.wake_event.set()
+
+def _candidate_script_paths(home: Path) -> tuple:
+    """Locations searched for the WARP data manager script, in priority order"""
+    cwd = Path.cwd()
+    return (
+        # Current directory and subdirectories
+        cwd / "warp-manager-enhanced.py",
+        cwd / "warp-data-manager" / "warp-manager-enhanced.py",
+        
+        # Desktop locations
+        home / "Desktop" / "warp-data-manager" / "warp-data-manager" / "warp-manager-enhanced.py",
+        home / "Desktop" / "warp-manager-enhanced.py",
+        
+        # Home directory
+        home / "warp-manager-enhanced.py",
+        home / ".local" / "bin" / "warp-manager-enhanced.py",
+        
+        # System paths
+        Path("/usr/local/bin/warp-manager-enhanced.py"),
+        Path("/opt/warp-manager/warp-manager-enhanced.py")
+    )
+
 class WARPMonitor:
     """Monitors WARP terminals and handles automatic backups"""
     
@@ -39,12 +150,23 @@ class WARPMonitor:
         self.backup_interval = 1800  # 30 minutes in seconds
         self.last_backup = None
         self.github_config = self.home / ".warp-manager-config.json"
+        self._wake = threading.Event()
+        self._backup_mod = None
+        self._backup_lock = threading.Lock()
+        self._stuck_backup = None  # backup worker that outlived BACKUP_TIMEOUT
+        self._running_cache = None  # (monotonic timestamp, bool)
+        self._pid_cache = None  # (monotonic timestamp, pid or None)
+        self._pid_ctime = None  # creation time recorded alongside the cached pid
+        self._backup_times_key = None  # (last_backup, backup_interval) of the cached strings
+        self.backup_script = None
         
         # Load configuration
         self.load_config()
         
-        # WARP data manager path
-        self.backup_script = self.find_backup_script()
+        # WARP data manager path (load_config reuses a previously found one)
+        if self.backup_script is None:
+            self.backup_script = self.find_backup_script()
+            self._prepare_backup_argv()
         
     def load_config(self):
         """Load monitor configuration"""
@@ -54,6 +176,9 @@ class WARPMonitor:
             "log_level": "INFO",
             "backup_types": ["rules", "mcp", "database", "preferences"],
             "github_sync": True,
+            "poll_interval_seconds": 60,
+            "max_poll_interval_seconds": 600,
+            "match_cmdline": False,
             "monitor_processes": [
                 "warp-terminal",
                 "warp", 
@@ -72,116 +197,261 @@ class WARPMonitor:
         
         self.config = default_config
         self.backup_interval = self.config["backup_interval_minutes"] * 60
+        self._warp_names_lower = tuple(n.lower() for n in self.config["monitor_processes"])
+        # Most WARP processes carry one of the names verbatim; try a set lookup first
+        self._exact_names = frozenset(self._warp_names_lower)
+        
+        # Reuse the backup script location found on a previous run
+        cached_script = self.config.get("backup_script_path")
+        if cached_script and Path(cached_script).is_file():
+            self.backup_script = Path(cached_script)
+        
+        self._prepare_backup_argv()
         
         # Save config
         self.save_config()
         
     def save_config(self):
-        """Save monitor configuration"""
+        """Save monitor configuration (skipped when unchanged, written atomically)"""
         try:
-            with open(self.config_file, 'w') as f:
-                json.dump(self.config, f, indent=2)
+            data = json.dumps(self.config, indent=2).encode()
+            try:
+                if self.config_file.read_bytes() == data:
+                    return
+            except FileNotFoundError:
+                pass
+            
+            tmp_file = self.config_file.with_suffix('.json.tmp')
+            tmp_file.write_bytes(data)
+            os.replace(tmp_file, self.config_file)
         except Exception as e:
             logger.error(f"Failed to save config: {e}")
     
+    def _prepare_backup_argv(self):
+        """Build the backup options once per configuration change"""
+        self._backup_sync = self.config.get("github_sync", True)
+        self._backup_argv = None
+        if self.backup_script:
+            self._backup_argv = ["python3", str(self.backup_script), "--backup", *self.config["backup_types"]]
+            if self._backup_sync:
+                self._backup_argv.append("--upload")
+    
     def find_backup_script(self) -> Optional[Path]:
         """Find the WARP data manager script"""
-        possible_paths = [
-            # Current directory and subdirectories
-            Path.cwd() / "warp-manager-enhanced.py",
-            Path.cwd() / "warp-data-manager" / "warp-manager-enhanced.py",
-            
-            # Desktop locations
-            self.home / "Desktop" / "warp-data-manager" / "warp-data-manager" / "warp-manager-enhanced.py",
-            self.home / "Desktop" / "warp-manager-enhanced.py",
-            
-            # Home directory
-            self.home / "warp-manager-enhanced.py",
-            self.home / ".local" / "bin" / "warp-manager-enhanced.py",
-            
-            # System paths
-            Path("/usr/local/bin/warp-manager-enhanced.py"),
-            Path("/opt/warp-manager/warp-manager-enhanced.py")
-        ]
-        
-        for path in possible_paths:
-            if path.exists() and path.is_file():
+        for path in _candidate_script_paths(self.home):
+            if path.is_file():
                 logger.info(f"Found backup script: {path}")
+                self.config["backup_script_path"] = str(path)
+                self.save_config()
                 return path
                 
         logger.warning("Backup script not found in standard locations")
         return None
     
-    def is_warp_running(self) -> bool:
-        """Check if any WARP terminal processes are running"""
-        warp_processes = []
+    def _process_names(self):
+        """Yield (pid, lowercased name) pairs; the name is empty if unavailable"""
+        if IS_LINUX:
+            # /proc/<pid>/comm is a single small read per process
+            for pid in psutil.pids():
+                try:
+                    with open(f"/proc/{pid}/comm") as f:
+                        yield pid, f.read().strip().lower()
+                except OSError:
+                    yield pid, ""
+            return
         
-        for proc in psutil.process_iter(['pid', 'name', 'cmdline']):
+        # process_iter() reuses its cached Process objects across ticks
+        for proc in psutil.process_iter():
             try:
-                proc_info = proc.info
-                proc_name = proc_info['name'].lower() if proc_info['name'] else ""
-                cmdline = ' '.join(proc_info['cmdline']).lower() if proc_info['cmdline'] else ""
-                
-                # Check for WARP processes
-                for warp_name in self.config["monitor_processes"]:
-                    if warp_name.lower() in proc_name or warp_name.lower() in cmdline:
-                        warp_processes.append({
-                            'pid': proc_info['pid'],
-                            'name': proc_info['name'],
-                            'cmdline': proc_info['cmdline']
-                        })
-                        break
-                        
+                yield proc.pid, proc.name().lower()
+            except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
+                yield proc.pid, ""
+    
+    def _argv_matches(self, cmdline) -> bool:
+        """Scan argv tokens for a configured name, lowercasing one token at a time"""
+        for tok in cmdline or ():
+            t = tok.lower()
+            if any(n in t for n in self._warp_names_lower):
+                return True
+        return False
+    
+    def _pid_cmdline_matches(self, pid: int) -> bool:
+        """Check a single process' command line against the configured names"""
+        try:
+            return self._argv_matches(psutil.Process(pid).cmdline())
+        except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
+            return False
+    
+    def _cmdline_matches(self) -> bool:
+        """Slow path: match configured names against full command lines"""
+        for proc in psutil.process_iter(['pid', 'cmdline']):
+            if self._argv_matches(proc.info['cmdline']):
+                logger.debug(f"  PID {proc.info['pid']} matched by command line")
+                return True
+        return False
+    
+    def _log_warp_processes(self):
+        """Debug helper: list every running process matching the configured names"""
+        warp_processes = []
+        for proc in psutil.process_iter():
+            try:
+                # Coalesce the /proc reads for this process into one snapshot
+                with proc.oneshot():
+                    name = proc.name()
+                    if any(n in name.lower() for n in self._warp_names_lower):
+                        warp_processes.append((proc.pid, name, proc.cmdline()))
             except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
                 continue
         
-        if warp_processes:
-            logger.debug(f"Found {len(warp_processes)} WARP processes")
-            for proc in warp_processes:
-                logger.debug(f"  PID {proc['pid']}: {proc['name']}")
+        logger.debug(f"Found {len(warp_processes)} WARP processes")
+        for pid, name, cmdline in warp_processes:
+            logger.debug(f"  PID {pid}: {name} ({' '.join(cmdline)})")
+    
+    def is_warp_running(self) -> bool:
+        """Check if any WARP terminal processes are running"""
+        exact_names = self._exact_names
+        names_lower = self._warp_names_lower
         
-        return len(warp_processes) > 0
+        for pid, comm in self._process_names():
+            if comm:
+                if comm in exact_names or any(n in comm for n in names_lower):
+                    if logger.isEnabledFor(logging.DEBUG):
+                        self._log_warp_processes()
+                    return True
+            elif self._pid_cmdline_matches(pid):
+                # Name unavailable - fall back to this process' command line
+                logger.debug(f"Found WARP process PID {pid} by command line")
+                return True
+        
+        # Command line matching is opt-in since it reads every process' argv
+        if self.config.get("match_cmdline", False):
+            return self._cmdline_matches()
+        
+        return False
+    
+    def _load_backup_module(self):
+        """Import the backup script once and cache the module"""
+        if self._backup_mod is None:
+            spec = importlib.util.spec_from_file_location("warp_manager_enhanced", self.backup_script)
+            module = importlib.util.module_from_spec(spec)
+            spec.loader.exec_module(module)
+            self._backup_mod = module
+        return self._backup_mod
     
-    def run_backup(self) -> bool:
-        """Execute backup with GitHub sync"""
+    def run_backup(self) -> Optional[bool]:
+        """Execute backup with GitHub sync; returns None if a previous backup is still running"""
         if not self.backup_script or not self.backup_script.exists():
             logger.error("Backup script not available")
             return False
         
+        if not self._backup_lock.acquire(blocking=False):
+            if self._backup_stuck():
+                # Already reported when it timed out
+                logger.debug("Timed-out backup still running - skipping")
+            else:
+                logger.warning("Backup already in progress")
+            return None
+        self._stuck_backup = None
+        
+        worker = None
         try:
             logger.info("Starting automated backup...")
             
-            # Prepare command
-            cmd = [
-                "python3", 
-                str(self.backup_script),
-                "--backup"
-            ] + self.config["backup_types"]
+            try:
+                module = self._load_backup_module()
+            except Exception as e:
+                logger.warning(f"Could not import backup script, falling back to subprocess: {e}")
+                module = None
+            
+            if module is None or not hasattr(module, "run_backup"):
+                return self._run_backup_subprocess()
+            
+            result = {}
+            
+            def do_backup():
+                # Owns the lock from here on so a hung backup keeps later ones out;
+                # the outcome is logged here so a late finish is still reported
+                try:
+                    result["ok"] = self._log_backup_result(
+                        module.run_backup(self.config["backup_types"], self._backup_sync))
+                except Exception as e:
+                    logger.error(f"❌ Backup error: {e}")
+                finally:
+                    self._backup_lock.release()
             
-            if self.config.get("github_sync", True):
-                cmd.append("--upload")
+            thread = threading.Thread(target=do_backup, name="warp-backup", daemon=True)
+            thread.start()
+            worker = thread
+            worker.join(BACKUP_TIMEOUT)
             
-            # Execute backup
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=600  # 10 minute timeout
-            )
+            if worker.is_alive():
+                logger.error(f"❌ Backup timed out after {BACKUP_TIMEOUT}s - skipping backups until it finishes")
+                self._stuck_backup = worker
+                return False
             
-            if result.returncode == 0:
+            return result.get("ok", False)
+        finally:
+            if worker is None:
+                self._backup_lock.release()
+    
+    def _backup_stuck(self) -> bool:
+        """Whether a timed-out backup worker is still running"""
+        return self._stuck_backup is not None and self._stuck_backup.is_alive()
+    
+    def _log_backup_result(self, result) -> bool:
+        """Log the (backup_path, uploaded) outcome of an in-process backup"""
+        backup_path, uploaded = result
+        if not backup_path:
+            logger.error("❌ Backup failed")
+            return False
+        
+        logger.info(f"✅ Backup completed successfully: {backup_path}")
+        if uploaded:
+            logger.info("📤 Backup uploaded to GitHub")
+        elif uploaded is not None:
+            logger.error("❌ GitHub upload failed")
+        return True
+    
+    def _run_backup_subprocess(self) -> bool:
+        """Run the backup script in a separate interpreter"""
+        try:
+            cmd = self._backup_argv
+            
+            # Execute backup, scanning output line by line instead of buffering it
+            uploaded = False
+            tail = deque(maxlen=20)
+            with subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+                                  text=True, bufsize=1) as proc:
+                timed_out = threading.Event()
+                
+                def kill_on_timeout():
+                    timed_out.set()
+                    proc.kill()
+                
+                timer = threading.Timer(BACKUP_TIMEOUT, kill_on_timeout)
+                timer.start()
+                try:
+                    for line in proc.stdout:
+                        tail.append(line.rstrip())
+                        uploaded = uploaded or "uploaded to github" in line.lower()
+                    returncode = proc.wait()
+                finally:
+                    timer.cancel()
+            
+            if timed_out.is_set():
+                logger.error("❌ Backup timed out")
+                return False
+            
+            if returncode == 0:
                 logger.info("✅ Backup completed successfully")
-                if "uploaded to GitHub" in result.stdout.lower():
+                if uploaded:
                     logger.info("📤 Backup uploaded to GitHub")
                 return True
             else:
-                logger.error(f"❌ Backup failed with code {result.returncode}")
-                logger.error(f"STDERR: {result.stderr}")
+                logger.error(f"❌ Backup failed with code {returncode}")
+                logger.error("OUTPUT: " + "\n".join(tail))
                 return False
                 
-        except subprocess.TimeoutExpired:
-            logger.error("❌ Backup timed out")
-            return False
         except Exception as e:
             logger.error(f"❌ Backup error: {e}")
             return False
@@ -194,6 +464,95 @@ class WARPMonitor:
         time_since_backup = time.time() - self.last_backup
         return time_since_backup >= self.backup_interval
     
+    def _sleep(self, timeout: float) -> bool:
+        """Wait up to timeout seconds, returning True when woken early"""
+        woken = self._wake.wait(timeout)
+        self._wake.clear()
+        return woken
+    
+    def _sched_delay(self, timeout: float):
+        """Scheduler delay function that reacts to wake-ups and shutdown"""
+        woken = self._sleep(timeout)
+        if not self.running:
+            for event in self._scheduler.queue:
+                self._scheduler.cancel(event)
+        elif woken and self._check_event is not None:
+            # A process event arrived - re-check WARP right away
+            self._scheduler.cancel(self._check_event)
+            self._check_event = self._scheduler.enter(0, 1, self._check_warp)
+    
+    def _check_warp(self):
+        """Scheduled WARP-detection tick"""
+        self._check_event = None
+        try:
+            warp_active = self.is_warp_running()
+        except Exception as e:
+            logger.error(f"❌ Monitor loop error: {e}")
+            self._check_event = self._scheduler.enter(self._poll_interval, 1, self._check_warp)
+            return
+        
+        if warp_active:
+            logger.debug("WARP terminals detected - monitoring active")
+            self._current_interval = self._poll_interval
+            # The backup tick re-checks WARP itself, so no polling until it is due
+            if self._backup_event is None:
+                due = self.last_backup + self.backup_interval if self.last_backup else time.time()
+                self._backup_event = self._scheduler.enterabs(due, 0, self._maybe_backup)
+            return
+        
+        logger.debug("No WARP terminals detected - standby mode")
+        # Back off while idle, up to the configured maximum; with
+        # process events a WARP start wakes us immediately anyway
+        if self._event_driven:
+            self._current_interval = self._max_interval
+        else:
+            self._current_interval = min(self._current_interval * 2, self._max_interval)
+        self._check_event = self._scheduler.enter(self._current_interval, 1, self._check_warp)
+    
+    def _maybe_backup(self):
+        """Scheduled backup-due tick"""
+        self._backup_event = None
+        try:
+            warp_active = self.is_warp_running()
+        except Exception as e:
+            logger.error(f"❌ Monitor loop error: {e}")
+            warp_active = False
+        
+        if not warp_active:
+            # WARP went away; fall back to detection ticks until it returns
+            logger.debug("No WARP terminals detected - standby mode")
+            self._check_event = self._scheduler.enter(self._poll_interval, 1, self._check_warp)
+            return
+        
+        if not self.should_backup():
+            self._backup_event = self._scheduler.enterabs(
+                self.last_backup + self.backup_interval, 0, self._maybe_backup)
+            return
+        
+        if not self._backup_stuck():
+            logger.info("⏰ Backup interval reached - starting backup")
+        result = self.run_backup()
+        if result is None:
+            # A timed-out backup is still running; not a new failure
+            self._backup_event = self._scheduler.enter(self._poll_interval, 0, self._maybe_backup)
+            return
+        if result:
+            self.last_backup = time.time()
+            self._consecutive_failures = 0
+            next_backup = datetime.fromtimestamp(self.last_backup + self.backup_interval)
+            logger.info(f"✅ Next backup scheduled for {next_backup.strftime('%H:%M:%S')}")
+            self._backup_event = self._scheduler.enterabs(
+                self.last_backup + self.backup_interval, 0, self._maybe_backup)
+            return
+        
+        self._consecutive_failures += 1
+        logger.warning(f"❌ Backup failed ({self._consecutive_failures}/{self._max_failures})")
+        if self._consecutive_failures >= self._max_failures:
+            logger.error("🚨 Too many consecutive backup failures - stopping monitor")
+            self.running = False
+            return
+        self._backup_event = self._scheduler.enter(self._poll_interval, 0, self._maybe_backup)
+    
     def monitor_loop(self):
         """Main monitoring loop"""
         logger.info("🚀 WARP Terminal Monitor started")
@@ -201,42 +560,28 @@ class WARPMonitor:
         logger.info(f"📦 Backup types: {', '.join(self.config['backup_types'])}")
         logger.info(f"☁️  GitHub sync: {'Enabled' if self.config['github_sync'] else 'Disabled'}")
         
-        consecutive_failures = 0
-        max_failures = 5
+        self._consecutive_failures = 0
+        self._max_failures = 5
+        self._poll_interval = self.config["poll_interval_seconds"]
+        self._max_interval = max(self._poll_interval, self.config["max_poll_interval_seconds"])
+        self._current_interval = self._poll_interval
         
-        while self.running:
-            try:
-                warp_active = self.is_warp_running()
-                
-                if warp_active:
-                    logger.debug("WARP terminals detected - monitoring active")
-                    
-                    if self.should_backup():
-                        logger.info("⏰ Backup interval reached - starting backup")
-                        
-                        if self.run_backup():
-                            self.last_backup = time.time()
-                            consecutive_failures = 0
-                            logger.info(f"✅ Next backup scheduled for {datetime.fromtimestamp(self.last_backup + self.backup_interval).strftime('%H:%M:%S')}")
-                        else:
-                            consecutive_failures += 1
-                            logger.warning(f"❌ Backup failed ({consecutive_failures}/{max_failures})")
-                            
-                            if consecutive_failures >= max_failures:
-                                logger.error("🚨 Too many consecutive backup failures - stopping monitor")
-                                break
-                else:
-                    logger.debug("No WARP terminals detected - standby mode")
-                
-                # Sleep for 60 seconds between checks
-                time.sleep(60)
-                
-            except KeyboardInterrupt:
-                logger.info("🛑 Received interrupt signal")
-                break
-            except Exception as e:
-                logger.error(f"❌ Monitor loop error: {e}")
-                time.sleep(60)  # Wait before retrying
+        # Prefer kernel exec events over frequent polling when available
+        listener = ProcExecListener(self._warp_names_lower, self._wake)
+        self._event_driven = listener.open()
+        if self._event_driven:
+            listener.start()
+            logger.info("⚡ Using process events for WARP detection")
+        
+        # Two independent timers: WARP detection and the backup deadline
+        self._scheduler = sched.scheduler(time.time, self._sched_delay)
+        self._backup_event = None
+        self._check_event = self._scheduler.enter(0, 1, self._check_warp)
+        
+        try:
+            self._scheduler.run()
+        except KeyboardInterrupt:
+            logger.info("🛑 Received interrupt signal")
         
         logger.info("🛑 WARP Terminal Monitor stopped")
     
@@ -246,9 +591,10 @@ class WARPMonitor:
             logger.warning("Monitor is already running")
             return False
             
-        # Write PID file
+        # Write PID file; the creation time identifies this process if the PID is reused
         with open(self.pid_file, 'w') as f:
-            f.write(str(os.getpid()))
+            json.dump({"pid": os.getpid(), "ctime": psutil.Process().create_time()}, f)
+        self._invalidate_status_cache()
         
         # Set up signal handlers
         signal.signal(signal.SIGTERM, self._signal_handler)
@@ -260,6 +606,7 @@ class WARPMonitor:
         # Clean up PID file
         if self.pid_file.exists():
             self.pid_file.unlink()
+        self._invalidate_status_cache()
             
         return True
     
@@ -277,6 +624,7 @@ class WARPMonitor:
                 
                 # Wait for process to stop
                 for _ in range(10):
+                    self._invalidate_status_cache()
                     if not self.is_running():
                         logger.info("Monitor stopped successfully")
                         return True
@@ -295,49 +643,105 @@ class WARPMonitor:
         # Clean up PID file
         if self.pid_file.exists():
             self.pid_file.unlink()
+        self._invalidate_status_cache()
             
         return True
     
+    def _invalidate_status_cache(self):
+        """Forget cached PID-file and liveness results"""
+        self._running_cache = None
+        self._pid_cache = None
+    
     def is_running(self) -> bool:
         """Check if monitor daemon is running"""
-        if not self.pid_file.exists():
-            return False
-            
-        try:
-            with open(self.pid_file) as f:
-                pid = int(f.read().strip())
-            
-            # Check if process exists and is our monitor
+        now = time.monotonic()
+        if self._running_cache and now - self._running_cache[0] < STATUS_CACHE_TTL:
+            return self._running_cache[1]
+        
+        pid = self.get_running_pid()
+        running = bool(pid) and self._pid_alive(pid, self._pid_ctime)
+        
+        self._running_cache = (now, running)
+        return running
+    
+    def _pid_alive(self, pid: int, ctime: Optional[float]) -> bool:
+        """Check the PID is alive and is still the process that wrote the PID file"""
+        if os.name == "nt":
+            # os.kill(pid, 0) would terminate the process on Windows
+            if not psutil.pid_exists(pid):
+                return False
+        else:
             try:
-                proc = psutil.Process(pid)
-                cmdline = ' '.join(proc.cmdline())
-                return 'warp_persistent_monitor' in cmdline
-            except (psutil.NoSuchProcess, psutil.AccessDenied):
+                os.kill(pid, 0)
+            except ProcessLookupError:
                 return False
-                
-        except (ValueError, FileNotFoundError):
+            except PermissionError:
+                pass
+        
+        if ctime is None:
+            # PID file from an older version without a creation time; only trust it
+            # if the PID still runs a Python interpreter, otherwise treat it as stale
+            if not IS_LINUX:
+                return False
+            try:
+                with open(f"/proc/{pid}/comm") as f:
+                    return f.read().strip().startswith("python")
+            except OSError:
+                return False
+        
+        try:
+            return abs(psutil.Process(pid).create_time() - ctime) < 1e-3
+        except psutil.NoSuchProcess:
             return False
+        except psutil.AccessDenied:
+            return True
     
     def get_running_pid(self) -> Optional[int]:
         """Get PID of running monitor"""
-        if not self.pid_file.exists():
-            return None
-            
+        now = time.monotonic()
+        if self._pid_cache and now - self._pid_cache[0] < STATUS_CACHE_TTL:
+            return self._pid_cache[1]
+        
+        ctime = None
         try:
             with open(self.pid_file) as f:
-                return int(f.read().strip())
-        except (ValueError, FileNotFoundError):
-            return None
+                data = json.load(f)
+            if isinstance(data, dict):
+                pid = int(data["pid"])
+                ctime = data.get("ctime")
+            else:
+                pid = int(data)
+        except (ValueError, KeyError, TypeError, FileNotFoundError):
+            pid = None
+        
+        self._pid_cache = (now, pid)
+        self._pid_ctime = ctime
+        return pid
+    
+    def _backup_times(self):
+        """Formatted last/next backup times, rebuilt only when either changes"""
+        key = (self.last_backup, self.backup_interval)
+        if key != self._backup_times_key:
+            if self.last_backup:
+                self._backup_times_cache = (
+                    datetime.fromtimestamp(self.last_backup).isoformat(),
+                    datetime.fromtimestamp(self.last_backup + self.backup_interval).isoformat()
+                )
+            else:
+                self._backup_times_cache = (None, "When WARP starts")
+            self._backup_times_key = key
+        return self._backup_times_cache
     
     def get_status(self) -> Dict:
         """Get monitor status"""
+        last_backup, next_backup = self._backup_times()
         return {
             "running": self.is_running(),
             "pid": self.get_running_pid(),
             "warp_active": self.is_warp_running(),
             "backup_interval": self.config["backup_interval_minutes"],
-            "last_backup": datetime.fromtimestamp(self.last_backup).isoformat() if self.last_backup else None,
-            "next_backup": datetime.fromtimestamp(self.last_backup + self.backup_interval).isoformat() if self.last_backup else "When WARP starts",
+            "last_backup": last_backup,
+            "next_backup": next_backup,
             "backup_script": str(self.backup_script) if self.backup_script else "Not found",
             "github_configured": self.github_config.exists()
         }
@@ -346,6 +750,18 @@ class WARPMonitor:
         """Handle termination signals"""
         logger.info(f"Received signal {signum}")
         self.running = False
+        self._wake.set()
+
+def spawn_background() -> int:
+    """Start a detached foreground monitor in a new session and return its PID"""
+    proc = subprocess.Popen(
+        [sys.executable, str(Path(__file__).resolve()), "start", "--foreground"],
+        start_new_session=True,
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL
+    )
+    return proc.pid
 
 def main():
     """Main entry point"""
@@ -359,6 +775,8 @@ def main():
     parser.add_argument("--config", help="Path to configuration file")
     parser.add_argument("--interval", type=int, metavar="MINUTES",
                        help="Backup interval in minutes (default: 30)")
+    parser.add_argument("--poll-interval", type=int, metavar="SECONDS",
+                       help="Seconds between WARP process checks (default: 60)")
     
     args = parser.parse_args()
     
@@ -371,6 +789,11 @@ def main():
         monitor.backup_interval = args.interval * 60
         logger.info(f"Set backup interval to {args.interval} minutes")
     
+    if args.poll_interval:
+        monitor.config["poll_interval_seconds"] = args.poll_interval
+        monitor.save_config()
+        logger.info(f"Set poll interval to {args.poll_interval} seconds")
+    
     if args.action == "start":
         if monitor.is_running():
             print("❌ Monitor is already running")
@@ -390,15 +813,8 @@ def main():
         if args.foreground:
             monitor.start_daemon()
         else:
-            # Fork to background
-            pid = os.fork()
-            if pid == 0:
-                # Child process - become daemon
-                os.setsid()
-                monitor.start_daemon()
-            else:
-                # Parent process
-                print(f"✅ Monitor started in background (PID: {pid})")
+            pid = spawn_background()
+            print(f"✅ Monitor started in background (PID: {pid})")
     
     elif args.action == "stop":
         if not monitor.is_running():
@@ -422,12 +838,8 @@ def main():
         if args.foreground:
             monitor.start_daemon()
         else:
-            pid = os.fork()
-            if pid == 0:
-                os.setsid()
-                monitor.start_daemon()
-            else:
-                print(f"✅ Monitor restarted in background (PID: {pid})")
+            pid = spawn_background()
+            print(f"✅ Monitor restarted in background (PID: {pid})")
     
     elif args.action == "status":
         status = monitor.get_status()
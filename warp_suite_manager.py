@@ -7,13 +7,179 @@ Manages WARP Client configurations and provides easy access to WARP features
 import sys
 import os
 import subprocess
+import shutil
 import json
+import hashlib
 import logging
+import platform
+import functools
+from collections import deque
 from pathlib import Path
 from PyQt5.QtWidgets import *
 from PyQt5.QtCore import *
 from PyQt5.QtGui import *
 
+try:
+    import psutil
+    PSUTIL_AVAILABLE = True
+except ImportError:
+    PSUTIL_AVAILABLE = False
+
+# Paths resolved once at import
+_HERE = Path(__file__).resolve().parent
+_CONFIG_PATH = _HERE / "config" / "default_config.json"
+_BACKUP_PATH = _HERE / "config" / "backup_config.json"
+_LAUNCHER = _HERE / "launcher.sh"
+_ICON_PATH = _HERE / "assets" / "icons" / "warp_client.png"
+
+# Center panel tabs that are created lazily
+_CONFIG_TAB = 2
+_LOGS_TAB = 3
+
+# Static tab texts, built once at import
+_TERMINAL_WELCOME = ("WARP Terminal Manager\n" +
+                     "=" * 40 + "\n"
+                     "Welcome to the WARP Terminal interface.\n"
+                     "Use the buttons in the left panel to launch WARP GUI or CLI.\n"
+                     "For command-line access, you can also use:\n"
+                     "  warp-client gui    # Launch GUI mode\n"
+                     "  warp-client cli    # Launch CLI mode\n\n"
+                     "System ready.\n\n")
+
+_LOG_VIEWER_HEADER = ("WARP Terminal Manager Log Viewer\n" +
+                      "=" * 50 + "\n"
+                      "Application logs will appear here.\n\n")
+
+_ABOUT_TEXT = ("WARP Terminal Manager v1.0\n\n"
+               "A simple management interface for the WARP Terminal client.\n"
+               "Provides easy access to WARP GUI and CLI modes with configuration management.\n\n"
+               "Features:\n"
+               "• WARP Client integration\n"
+               "• Configuration management\n"
+               "• Process monitoring\n"
+               "• Activity logging\n"
+               "• Backup and restore")
+
+_USER_GUIDE_TEXT = """WARP Terminal Manager User Guide
+=================================
+
+Getting Started:
+1. Use the left panel to launch WARP GUI or CLI
+2. Configure settings in the Configuration tab
+3. Monitor active sessions in the right panel
+
+Quick Actions:
+• Backup Configuration: Save current settings
+• Restore Configuration: Restore from backup
+• Clear Application Logs: Clean up log files
+
+Navigation:
+• Dashboard: Overview of system status
+• Terminal: Command interface information
+• Configuration: Edit settings and preferences
+• Logs: View and export application logs
+
+For more help, visit the WARP Terminal documentation."""
+
+@functools.lru_cache(maxsize=1)
+def _app_icon():
+    """Application icon, loaded once (requires a QApplication)"""
+    return QIcon(str(_ICON_PATH))
+
+# Formatted config text keyed by path, valid while the file's mtime is unchanged
+_CONFIG_CACHE = {}
+
+def _load_config_cached(path):
+    """Return the config file as indented JSON, re-parsing only when it changed"""
+    mtime = path.stat().st_mtime_ns
+    cached = _CONFIG_CACHE.get(path)
+    if cached and cached[0] == mtime:
+        return cached[1]
+    
+    with open(path, 'r') as f:
+        content = json.dumps(json.load(f), indent=2)
+    _CONFIG_CACHE[path] = (mtime, content)
+    return content
+
+def _write_document(f, doc):
+    """Write a QTextDocument to f one line per block"""
+    block = doc.firstBlock()
+    while block.isValid():
+        f.write(block.text())
+        f.write("\n")
+        block = block.next()
+
+class ActivityModel(QAbstractListModel):
+    """Bounded list model holding the most recent activity entries"""
+    
+    def __init__(self, maxlen=10, parent=None):
+        super().__init__(parent)
+        self._items = deque(maxlen=maxlen)
+    
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._items)
+    
+    def data(self, index, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and index.isValid():
+            return self._items[index.row()]
+        return None
+    
+    def append(self, texts):
+        """Append entries, evicting the oldest ones beyond maxlen"""
+        maxlen = self._items.maxlen
+        texts = texts[-maxlen:]
+        if not texts:
+            return
+        
+        overflow = min(len(self._items) + len(texts) - maxlen, len(self._items))
+        if overflow > 0:
+            self.beginRemoveRows(QModelIndex(), 0, overflow - 1)
+            for _ in range(overflow):
+                self._items.popleft()
+            self.endRemoveRows()
+        
+        first = len(self._items)
+        self.beginInsertRows(QModelIndex(), first, first + len(texts) - 1)
+        self._items.extend(texts)
+        self.endInsertRows()
+
+class StatusTile(QLabel):
+    """Label that only re-renders when its text actually changes"""
+    
+    def __init__(self, text="", parent=None):
+        super().__init__(text, parent)
+        self._value = text
+    
+    def set(self, text):
+        if text != self._value:
+            self._value = text
+            self.setText(text)
+
+class _SpawnSignals(QObject):
+    """Signals emitted by _SpawnTask back to the GUI thread"""
+    started = pyqtSignal(str, object, str)  # key, Popen, log message
+    failed = pyqtSignal(str, str)  # label, error
+
+class _SpawnTask(QRunnable):
+    """Run subprocess.Popen off the GUI thread so fork/exec never stalls the UI"""
+    
+    def __init__(self, signals, key, label, args, message, popen_kwargs):
+        super().__init__()
+        self.signals = signals
+        self.key = key
+        self.label = label
+        self.args = args
+        self.message = message
+        self.popen_kwargs = popen_kwargs
+    
+    def run(self):
+        try:
+            process = subprocess.Popen(self.args, **self.popen_kwargs)
+        except Exception as e:
+            self.signals.failed.emit(self.label, str(e))
+            return
+        self.signals.started.emit(self.key, process, self.message)
+
 class WarpSuiteManager(QMainWindow):
     """Main WARP Suite Manager window"""
     
@@ -23,12 +189,32 @@ class WarpSuiteManager(QMainWindow):
         self.setGeometry(100, 100, 900, 600)
         
         # Set window icon
-        icon_path = Path(__file__).parent / "assets" / "icons" / "warp_client.png"
-        if icon_path.exists():
-            self.setWindowIcon(QIcon(str(icon_path)))
+        icon = _app_icon()
+        if not icon.isNull():
+            self.setWindowIcon(icon)
         
         # Initialize components
         self.running_processes = {}
+        self._guide_dialog = None
+        self._about_box = None
+        self._list_items = {}  # process key -> QListWidgetItem
+        
+        # Reap finished processes while any are tracked
+        self._reap_timer = QTimer(self)
+        self._reap_timer.setInterval(1000)
+        self._reap_timer.timeout.connect(self.update_process_list)
+        
+        # Activity log lines are buffered and written to the widgets in batches
+        self._log_queue = []
+        self._log_flush_timer = QTimer(self)
+        self._log_flush_timer.setSingleShot(True)
+        self._log_flush_timer.setInterval(50)
+        self._log_flush_timer.timeout.connect(self._flush_logs)
+        
+        # Process launches run on the thread pool and report back here
+        self._spawn_signals = _SpawnSignals(self)
+        self._spawn_signals.started.connect(self._on_process_started)
+        self._spawn_signals.failed.connect(self._on_process_failed)
         
         self.setupUI()
         self.applyTheme()
@@ -145,17 +331,39 @@ class WarpSuiteManager(QMainWindow):
         terminal = self.createTerminalTab()
         tabs.addTab(terminal, "💻 Terminal")
         
-        # Configuration tab
-        config = self.createConfigTab()
-        tabs.addTab(config, "⚙️ Configuration")
-        
-        # Logs tab
-        logs = self.createLogsTab()
-        tabs.addTab(logs, "📋 Logs")
+        # Configuration and logs tabs are built on first use
+        self.config_editor = None
+        self.log_viewer = None
+        self._lazy_tabs = {_CONFIG_TAB: self.createConfigTab, _LOGS_TAB: self.createLogsTab}
+        tabs.addTab(QWidget(), "⚙️ Configuration")
+        tabs.addTab(QWidget(), "📋 Logs")
+        tabs.currentChanged.connect(self._ensure_tab)
         
+        self.center_tabs = tabs
         layout.addWidget(tabs)
         return panel
     
+    def _ensure_tab(self, index):
+        """Replace a placeholder tab with its real widget the first time it is needed"""
+        factory = self._lazy_tabs.pop(index, None)
+        if factory is None:
+            return
+        
+        tabs = self.center_tabs
+        current = tabs.currentIndex()
+        placeholder = tabs.widget(index)
+        label = tabs.tabText(index)
+        
+        tabs.blockSignals(True)
+        tabs.removeTab(index)
+        tabs.insertTab(index, factory(), label)
+        tabs.setCurrentIndex(current)
+        tabs.blockSignals(False)
+        placeholder.deleteLater()
+        
+        if not self._lazy_tabs:
+            tabs.currentChanged.disconnect(self._ensure_tab)
+    
     def createRightPanel(self):
         """Create right panel with system info and logs"""
         panel = QWidget()
@@ -167,10 +375,18 @@ class WarpSuiteManager(QMainWindow):
         sys_layout = QVBoxLayout()
         
         self.sys_info_label = QLabel()
+        self._last_sysinfo = None
         self.update_system_info()
         self.sys_info_label.setAlignment(Qt.AlignTop)
         sys_layout.addWidget(self.sys_info_label)
         
+        # Refresh system info periodically at a low rate
+        self.sys_info_timer = QTimer(self)
+        self.sys_info_timer.setInterval(5000)
+        self.sys_info_timer.timeout.connect(self.update_system_info)
+        if PSUTIL_AVAILABLE:
+            self.sys_info_timer.start()
+        
         sys_group.setLayout(sys_layout)
         layout.addWidget(sys_group)
         
@@ -192,7 +408,10 @@ class WarpSuiteManager(QMainWindow):
         log_group = QGroupBox("📜 Activity Log")
         log_layout = QVBoxLayout()
         
-        self.activity_log = QTextEdit()
+        self.activity_log = QPlainTextEdit()
+        self.activity_log.setMaximumBlockCount(500)
+        # Unwrapped lines keep each block one line high, so appends need no re-wrapping
+        self.activity_log.setLineWrapMode(QPlainTextEdit.NoWrap)
         self.activity_log.setMaximumHeight(150)
         self.activity_log.setReadOnly(True)
         log_layout.addWidget(self.activity_log)
@@ -221,28 +440,28 @@ class WarpSuiteManager(QMainWindow):
         stats_layout = QGridLayout()
         
         # WARP status
-        warp_status = QLabel("🚀 WARP Terminal\nReady")
-        warp_status.setStyleSheet("border: 1px solid gray; padding: 20px; text-align: center; background-color: #004d2d;")
+        warp_status = StatusTile("🚀 WARP Terminal\nReady")
+        warp_status.setObjectName("statTile_warp")
         warp_status.setAlignment(Qt.AlignCenter)
         stats_layout.addWidget(warp_status, 0, 0)
         
         # System status
-        sys_status = QLabel("💻 System\nOnline")
-        sys_status.setStyleSheet("border: 1px solid gray; padding: 20px; text-align: center; background-color: #1a472a;")
+        sys_status = StatusTile("💻 System\nOnline")
+        sys_status.setObjectName("statTile_system")
         sys_status.setAlignment(Qt.AlignCenter)
         stats_layout.addWidget(sys_status, 0, 1)
         
         # Configuration status
-        config_status = QLabel("⚙️ Configuration\nLoaded")
-        config_status.setStyleSheet("border: 1px solid gray; padding: 20px; text-align: center; background-color: #2d4a22;")
+        config_status = StatusTile("⚙️ Configuration\nLoaded")
+        config_status.setObjectName("statTile_config")
         config_status.setAlignment(Qt.AlignCenter)
         stats_layout.addWidget(config_status, 1, 0)
         
         # Session status
-        session_status = QLabel("🔗 Sessions\n0 Active")
-        session_status.setStyleSheet("border: 1px solid gray; padding: 20px; text-align: center; background-color: #3d2a42;")
-        session_status.setAlignment(Qt.AlignCenter)
-        stats_layout.addWidget(session_status, 1, 1)
+        self.session_tile = StatusTile("🔗 Sessions\n0 Active")
+        self.session_tile.setObjectName("statTile_sessions")
+        self.session_tile.setAlignment(Qt.AlignCenter)
+        stats_layout.addWidget(self.session_tile, 1, 1)
         
         layout.addLayout(stats_layout)
         
@@ -250,8 +469,12 @@ class WarpSuiteManager(QMainWindow):
         recent_group = QGroupBox("📋 Recent Activities")
         recent_layout = QVBoxLayout()
         
-        self.recent_activities = QListWidget()
-        self.recent_activities.addItem("WARP Terminal Manager started")
+        self.recent_model = ActivityModel(10, self)
+        self.recent_model.append(["WARP Terminal Manager started"])
+        self.recent_activities = QListView()
+        self.recent_activities.setUniformItemSizes(True)
+        self.recent_activities.setLayoutMode(QListView.Batched)
+        self.recent_activities.setModel(self.recent_model)
         recent_layout.addWidget(self.recent_activities)
         
         recent_group.setLayout(recent_layout)
@@ -264,14 +487,7 @@ class WarpSuiteManager(QMainWindow):
         """Create terminal tab"""
         terminal = QTextEdit()
         terminal.setStyleSheet("background-color: black; color: green; font-family: monospace;")
-        terminal.setPlainText("WARP Terminal Manager\n" +
-                             "=" * 40 + "\n" +
-                             "Welcome to the WARP Terminal interface.\n" +
-                             "Use the buttons in the left panel to launch WARP GUI or CLI.\n" +
-                             "For command-line access, you can also use:\n" +
-                             "  warp-client gui    # Launch GUI mode\n" +
-                             "  warp-client cli    # Launch CLI mode\n\n" +
-                             "System ready.\n\n")
+        terminal.setPlainText(_TERMINAL_WELCOME)
         return terminal
     
     def createConfigTab(self):
@@ -288,16 +504,24 @@ class WarpSuiteManager(QMainWindow):
         
         # Load current configuration
         try:
-            config_path = Path(__file__).parent / "config" / "default_config.json"
-            if config_path.exists():
-                with open(config_path, 'r') as f:
-                    config_content = json.dumps(json.load(f), indent=2)
-                    self.config_editor.setPlainText(config_content)
+            if _CONFIG_PATH.exists():
+                self.config_editor.setPlainText(_load_config_cached(_CONFIG_PATH))
         except Exception as e:
             self.config_editor.setPlainText(f"# Error loading configuration: {e}")
         
         config_layout.addWidget(self.config_editor)
         
+        # Live validation, run once typing pauses
+        self.config_validity = QLabel()
+        config_layout.addWidget(self.config_validity)
+        self._validated_digest = None
+        self._validate_timer = QTimer(self)
+        self._validate_timer.setSingleShot(True)
+        self._validate_timer.setInterval(300)
+        self._validate_timer.timeout.connect(self._validate_now)
+        self.config_editor.textChanged.connect(self._validate_timer.start)
+        self._validate_now()
+        
         # Configuration buttons
         config_buttons = QHBoxLayout()
         
@@ -329,12 +553,11 @@ class WarpSuiteManager(QMainWindow):
         logs_group = QGroupBox("📜 Log Viewer")
         logs_layout = QVBoxLayout()
         
-        self.log_viewer = QTextEdit()
+        self.log_viewer = QPlainTextEdit()
+        self.log_viewer.setMaximumBlockCount(5000)
         self.log_viewer.setReadOnly(True)
         self.log_viewer.setStyleSheet("font-family: monospace; background-color: #1e1e1e; color: #ffffff;")
-        self.log_viewer.setPlainText("WARP Terminal Manager Log Viewer\n" +
-                                   "=" * 50 + "\n" +
-                                   "Application logs will appear here.\n\n")
+        self.log_viewer.setPlainText(_LOG_VIEWER_HEADER)
         logs_layout.addWidget(self.log_viewer)
         
         # Log controls
@@ -370,6 +593,9 @@ class WarpSuiteManager(QMainWindow):
         
         self.status_warp = QLabel("🚀 Ready")
         self.status_bar.addPermanentWidget(self.status_warp)
+        
+        self.status_sessions = StatusTile("🔗 0")
+        self.status_bar.addPermanentWidget(self.status_sessions)
     
     def setupMenuBar(self):
         """Setup menu bar"""
@@ -458,7 +684,7 @@ class WarpSuiteManager(QMainWindow):
                 left: 10px;
                 padding: 0 5px 0 5px;
             }
-            QTextEdit, QListWidget {
+            QTextEdit, QPlainTextEdit, QListWidget, QListView {
                 background-color: #1e1e1e;
                 border: 1px solid #404040;
                 border-radius: 4px;
@@ -475,22 +701,45 @@ class WarpSuiteManager(QMainWindow):
             QTabBar::tab:selected {
                 background-color: #505050;
             }
+            QLabel#statTile_warp, QLabel#statTile_system,
+            QLabel#statTile_config, QLabel#statTile_sessions {
+                border: 1px solid gray;
+                padding: 20px;
+                text-align: center;
+            }
+            QLabel#statTile_warp {
+                background-color: #004d2d;
+            }
+            QLabel#statTile_system {
+                background-color: #1a472a;
+            }
+            QLabel#statTile_config {
+                background-color: #2d4a22;
+            }
+            QLabel#statTile_sessions {
+                background-color: #3d2a42;
+            }
         """)
     
     def update_system_info(self):
         """Update system information display"""
+        if not PSUTIL_AVAILABLE:
+            self.sys_info_label.setText("System info unavailable\n(psutil not installed)")
+            return
+        
         try:
-            import platform
-            import psutil
+            # Non-blocking sample since the previous call
+            sysinfo = (psutil.cpu_percent(interval=None), psutil.virtual_memory().percent)
+            if sysinfo == self._last_sysinfo:
+                return
+            self._last_sysinfo = sysinfo
             
             info = f"OS: {platform.system()} {platform.release()}\n"
-            info += f"CPU: {psutil.cpu_percent()}%\n"
-            info += f"Memory: {psutil.virtual_memory().percent}%\n"
+            info += f"CPU: {sysinfo[0]}%\n"
+            info += f"Memory: {sysinfo[1]}%\n"
             info += f"Python: {platform.python_version()}"
             
             self.sys_info_label.setText(info)
-        except ImportError:
-            self.sys_info_label.setText("System info unavailable\n(psutil not installed)")
         except Exception as e:
             self.sys_info_label.setText(f"Error: {str(e)}")
     
@@ -498,64 +747,53 @@ class WarpSuiteManager(QMainWindow):
     def launch_warp_gui(self):
         """Launch WARP GUI"""
         self.log_activity("Launching WARP GUI...")
-        try:
-            script_dir = Path(__file__).parent
-            launcher = script_dir / "launcher.sh"
-            
-            if launcher.exists():
-                process = subprocess.Popen([str(launcher)], 
-                                         cwd=script_dir,
-                                         stdout=subprocess.PIPE,
-                                         stderr=subprocess.PIPE)
-                
-                self.running_processes['warp-gui'] = process
-                self.update_process_list()
-                self.log_activity("WARP GUI launched successfully")
-            else:
-                # Fallback to Python launcher
-                process = subprocess.Popen(['python', 'launch_warp.py', 'gui'], 
-                                         cwd=script_dir)
-                
-                self.running_processes['warp-gui'] = process
-                self.update_process_list()
-                self.log_activity("WARP GUI launched successfully (fallback)")
-                
-        except Exception as e:
-            self.log_activity(f"Failed to launch WARP GUI: {e}")
-            QMessageBox.critical(self, "Error", f"Failed to launch WARP GUI: {e}")
+        if _LAUNCHER.exists():
+            self._spawn_process('warp-gui', "WARP GUI", [str(_LAUNCHER)],
+                                "WARP GUI launched successfully",
+                                cwd=_HERE,
+                                stdout=subprocess.DEVNULL,
+                                stderr=subprocess.DEVNULL)
+        else:
+            # Fallback to Python launcher
+            self._spawn_process('warp-gui', "WARP GUI", ['python', 'launch_warp.py', 'gui'],
+                                "WARP GUI launched successfully (fallback)",
+                                cwd=_HERE)
     
     def launch_warp_cli(self):
         """Launch WARP CLI"""
         self.log_activity("Launching WARP CLI...")
-        try:
-            script_dir = Path(__file__).parent
-            process = subprocess.Popen(['python', 'launch_warp.py', 'cli'], 
-                                     cwd=script_dir)
-            
-            self.running_processes['warp-cli'] = process
-            self.update_process_list()
-            self.log_activity("WARP CLI launched successfully")
-            
-        except Exception as e:
-            self.log_activity(f"Failed to launch WARP CLI: {e}")
-            QMessageBox.critical(self, "Error", f"Failed to launch WARP CLI: {e}")
+        self._spawn_process('warp-cli', "WARP CLI", ['python', 'launch_warp.py', 'cli'],
+                            "WARP CLI launched successfully",
+                            cwd=_HERE)
+    
+    def _spawn_process(self, key, label, args, message, **popen_kwargs):
+        """Start a process on the thread pool; results arrive via _spawn_signals"""
+        task = _SpawnTask(self._spawn_signals, key, label, args, message, popen_kwargs)
+        QThreadPool.globalInstance().start(task)
+    
+    def _on_process_started(self, key, process, message):
+        """Track a process started by _spawn_process"""
+        self.running_processes[key] = process
+        self._add_process_item(key, process)
+        self.log_activity(message)
+    
+    def _on_process_failed(self, label, error):
+        """Report a process that _spawn_process could not start"""
+        self.log_activity(f"Failed to launch {label}: {error}")
+        QMessageBox.critical(self, "Error", f"Failed to launch {label}: {error}")
     
     def open_warp_config(self):
         """Open WARP configuration editor"""
         self.log_activity("Opening WARP configuration...")
         # Switch to the configuration tab
-        tabs = self.centralWidget().layout().itemAt(1).widget()
-        tabs.setCurrentIndex(2)  # Configuration tab
+        self.center_tabs.setCurrentIndex(_CONFIG_TAB)
     
     def backup_configuration(self):
         """Backup current configuration"""
         self.log_activity("Creating configuration backup...")
         try:
-            config_path = Path(__file__).parent / "config" / "default_config.json"
-            backup_path = Path(__file__).parent / "config" / "backup_config.json"
-            
-            if config_path.exists():
-                subprocess.run(['cp', str(config_path), str(backup_path)], check=True)
+            if _CONFIG_PATH.exists():
+                shutil.copyfile(_CONFIG_PATH, _BACKUP_PATH)
                 self.log_activity("Configuration backed up successfully")
                 QMessageBox.information(self, "Backup", "Configuration backed up successfully!")
             else:
@@ -574,11 +812,8 @@ class WarpSuiteManager(QMainWindow):
         if reply == QMessageBox.Yes:
             self.log_activity("Restoring configuration from backup...")
             try:
-                config_path = Path(__file__).parent / "config" / "default_config.json"
-                backup_path = Path(__file__).parent / "config" / "backup_config.json"
-                
-                if backup_path.exists():
-                    subprocess.run(['cp', str(backup_path), str(config_path)], check=True)
+                if _BACKUP_PATH.exists():
+                    shutil.copyfile(_BACKUP_PATH, _CONFIG_PATH)
                     self.reload_configuration()
                     self.log_activity("Configuration restored successfully")
                     QMessageBox.information(self, "Restore", "Configuration restored successfully!")
@@ -599,7 +834,8 @@ class WarpSuiteManager(QMainWindow):
             self.log_activity("Clearing application logs...")
             # Clear various log files here
             self.clear_activity_log()
-            self.log_viewer.clear()
+            if self.log_viewer is not None:
+                self.log_viewer.clear()
             self.log_activity("Application logs cleared")
     
     def toggle_theme(self):
@@ -639,6 +875,7 @@ class WarpSuiteManager(QMainWindow):
                 }
             }
             
+            self._ensure_tab(_CONFIG_TAB)
             self.config_editor.setPlainText(json.dumps(basic_config, indent=2))
             self.log_activity("New configuration template created")
     
@@ -653,6 +890,7 @@ class WarpSuiteManager(QMainWindow):
             try:
                 with open(file_path, 'r') as f:
                     config_content = json.dumps(json.load(f), indent=2)
+                    self._ensure_tab(_CONFIG_TAB)
                     self.config_editor.setPlainText(config_content)
                     self.log_activity(f"Opened configuration: {file_path}")
             except Exception as e:
@@ -660,15 +898,17 @@ class WarpSuiteManager(QMainWindow):
     
     def save_configuration(self):
         """Save current configuration"""
+        self._ensure_tab(_CONFIG_TAB)
         try:
             config_text = self.config_editor.toPlainText()
-            config_data = json.loads(config_text)  # Validate JSON
+            json.loads(config_text)  # Validate JSON
             
-            config_path = Path(__file__).parent / "config" / "default_config.json"
-            config_path.parent.mkdir(exist_ok=True)
+            _CONFIG_PATH.parent.mkdir(exist_ok=True)
             
-            with open(config_path, 'w') as f:
-                json.dump(config_data, f, indent=2)
+            # Valid text is written as-is rather than re-serialized
+            with open(_CONFIG_PATH, 'w') as f:
+                f.write(config_text)
+            _CONFIG_CACHE.pop(_CONFIG_PATH, None)
             
             self.log_activity("Configuration saved successfully")
             QMessageBox.information(self, "Save", "Configuration saved successfully!")
@@ -680,18 +920,31 @@ class WarpSuiteManager(QMainWindow):
     
     def reload_configuration(self):
         """Reload configuration from file"""
+        self._ensure_tab(_CONFIG_TAB)
         try:
-            config_path = Path(__file__).parent / "config" / "default_config.json"
-            if config_path.exists():
-                with open(config_path, 'r') as f:
-                    config_content = json.dumps(json.load(f), indent=2)
-                    self.config_editor.setPlainText(config_content)
-                    self.log_activity("Configuration reloaded")
+            if _CONFIG_PATH.exists():
+                self.config_editor.setPlainText(_load_config_cached(_CONFIG_PATH))
+                self.log_activity("Configuration reloaded")
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Failed to reload configuration: {e}")
     
+    def _validate_now(self):
+        """Show whether the editor text is valid JSON, skipping unchanged text"""
+        text = self.config_editor.toPlainText()
+        digest = hashlib.md5(text.encode(), usedforsecurity=False).digest()
+        if digest == self._validated_digest:
+            return
+        self._validated_digest = digest
+        
+        try:
+            json.loads(text)
+            self.config_validity.setText("✅ Valid JSON")
+        except ValueError as e:
+            self.config_validity.setText(f"❌ Invalid JSON: {e}")
+    
     def validate_configuration(self):
         """Validate current configuration"""
+        self._ensure_tab(_CONFIG_TAB)
         try:
             config_text = self.config_editor.toPlainText()
             json.loads(config_text)  # Validate JSON syntax
@@ -708,7 +961,7 @@ class WarpSuiteManager(QMainWindow):
         """Refresh log viewer"""
         self.log_activity("Refreshing logs...")
         # Here you would load actual log files
-        self.log_viewer.append(f"[{QDateTime.currentDateTime().toString()}] Logs refreshed")
+        self.log_viewer.appendPlainText(f"[{QDateTime.currentDateTime().toString()}] Logs refreshed")
     
     def export_logs(self):
         """Export logs to file"""
@@ -719,10 +972,11 @@ class WarpSuiteManager(QMainWindow):
         
         if file_path:
             try:
-                with open(file_path, 'w') as f:
-                    f.write(self.log_viewer.toPlainText())
-                    f.write("\n\nActivity Log:\n")
-                    f.write(self.activity_log.toPlainText())
+                # Stream block by block rather than materializing each document
+                with open(file_path, 'w', buffering=1 << 20) as f:
+                    _write_document(f, self.log_viewer.document())
+                    f.write("\nActivity Log:\n")
+                    _write_document(f, self.activity_log.document())
                 
                 QMessageBox.information(self, "Export", "Logs exported successfully!")
                 self.log_activity(f"Logs exported to: {file_path}")
@@ -741,23 +995,45 @@ class WarpSuiteManager(QMainWindow):
             self.activity_log.clear()
             self.log_activity("All logs cleared")
     
+    def _add_process_item(self, name, process):
+        """Show a newly started process in the sessions list"""
+        item = self._list_items.get(name)
+        if item is None:
+            item = QListWidgetItem()
+            item.setData(Qt.UserRole, name)
+            self.process_list.addItem(item)
+            self._list_items[name] = item
+        item.setText(f"🔄 {name} (PID: {process.pid})")
+        self._update_session_count()
+        
+        if not self._reap_timer.isActive():
+            self._reap_timer.start()
+    
     def update_process_list(self):
-        """Update running processes list"""
-        self.process_list.clear()
+        """Remove finished processes from the sessions list"""
         for name, process in list(self.running_processes.items()):
-            if process.poll() is None:  # Process is still running
-                self.process_list.addItem(f"🔄 {name} (PID: {process.pid})")
-            else:
+            if process.poll() is not None:
                 # Process finished, remove from list
                 del self.running_processes[name]
+                item = self._list_items.pop(name, None)
+                if item is not None:
+                    self.process_list.takeItem(self.process_list.row(item))
+        
+        self._update_session_count()
+        if not self.running_processes:
+            self._reap_timer.stop()
+    
+    def _update_session_count(self):
+        """Show the number of tracked processes on the dashboard and status bar"""
+        count = len(self.running_processes)
+        self.session_tile.set(f"🔗 Sessions\n{count} Active")
+        self.status_sessions.set(f"🔗 {count}")
     
     def kill_selected_process(self):
         """Kill selected process"""
         current_item = self.process_list.currentItem()
         if current_item:
-            text = current_item.text()
-            # Extract process name from text
-            name = text.split()[1]  # Skip the emoji
+            name = current_item.data(Qt.UserRole)
             if name in self.running_processes:
                 process = self.running_processes[name]
                 process.terminate()
@@ -765,74 +1041,66 @@ class WarpSuiteManager(QMainWindow):
                 self.update_process_list()
     
     def log_activity(self, message):
-        """Log activity to the activity log"""
+        """Queue activity for the next batched log update"""
         timestamp = QDateTime.currentDateTime().toString("hh:mm:ss")
-        self.activity_log.append(f"[{timestamp}] {message}")
-        
-        # Add to recent activities
-        self.recent_activities.addItem(f"{timestamp}: {message}")
-        
-        # Limit recent activities to 10 items
-        while self.recent_activities.count() > 10:
-            self.recent_activities.takeItem(0)
+        self._log_queue.append((timestamp, message))
+        if not self._log_flush_timer.isActive():
+            self._log_flush_timer.start()
+    
+    def _flush_logs(self):
+        """Write queued activity to the log widgets in one update"""
+        if not self._log_queue:
+            return
+        entries, self._log_queue = self._log_queue, []
+        
+        self.activity_log.appendPlainText("\n".join(f"[{ts}] {msg}" for ts, msg in entries))
+        # Scroll once per batch rather than per entry
+        self.activity_log.moveCursor(QTextCursor.End)
+        self.activity_log.ensureCursorVisible()
+        
+        # Add to recent activities; the model keeps only the latest 10
+        self.recent_model.append([f"{ts}: {msg}" for ts, msg in entries])
     
     def clear_activity_log(self):
         """Clear activity log"""
+        self._log_queue.clear()
         self.activity_log.clear()
     
     def show_about(self):
         """Show about dialog"""
-        QMessageBox.about(self, "About WARP Terminal Manager", 
-                         "WARP Terminal Manager v1.0\n\n" +
-                         "A simple management interface for the WARP Terminal client.\n" +
-                         "Provides easy access to WARP GUI and CLI modes with configuration management.\n\n" +
-                         "Features:\n" +
-                         "• WARP Client integration\n" +
-                         "• Configuration management\n" +
-                         "• Process monitoring\n" +
-                         "• Activity logging\n" +
-                         "• Backup and restore")
+        # Build the message box once and reuse it afterwards
+        if self._about_box is None:
+            self._about_box = QMessageBox(self)
+            self._about_box.setWindowTitle("About WARP Terminal Manager")
+            self._about_box.setText(_ABOUT_TEXT)
+            self._about_box.setIcon(QMessageBox.Information)
+        self._about_box.show()
     
     def show_user_guide(self):
         """Show user guide"""
-        guide_text = """WARP Terminal Manager User Guide
-=================================
-
-Getting Started:
-1. Use the left panel to launch WARP GUI or CLI
-2. Configure settings in the Configuration tab
-3. Monitor active sessions in the right panel
-
-Quick Actions:
-• Backup Configuration: Save current settings
-• Restore Configuration: Restore from backup
-• Clear Application Logs: Clean up log files
-
-Navigation:
-• Dashboard: Overview of system status
-• Terminal: Command interface information
-• Configuration: Edit settings and preferences
-• Logs: View and export application logs
-
-For more help, visit the WARP Terminal documentation."""
-        
-        dialog = QDialog(self)
-        dialog.setWindowTitle("User Guide")
-        dialog.setMinimumSize(500, 400)
-        
-        layout = QVBoxLayout()
-        
-        guide_display = QTextEdit()
-        guide_display.setPlainText(guide_text)
-        guide_display.setReadOnly(True)
-        layout.addWidget(guide_display)
-        
-        close_btn = QPushButton("Close")
-        close_btn.clicked.connect(dialog.close)
-        layout.addWidget(close_btn)
+        # Build the dialog once and reuse it afterwards
+        if self._guide_dialog is None:
+            dialog = QDialog(self)
+            dialog.setWindowTitle("User Guide")
+            dialog.setMinimumSize(500, 400)
+            
+            layout = QVBoxLayout()
+            
+            guide_display = QTextEdit()
+            guide_display.setPlainText(_USER_GUIDE_TEXT)
+            guide_display.setReadOnly(True)
+            layout.addWidget(guide_display)
+            
+            close_btn = QPushButton("Close")
+            close_btn.clicked.connect(dialog.close)
+            layout.addWidget(close_btn)
+            
+            dialog.setLayout(layout)
+            self._guide_dialog = dialog
         
-        dialog.setLayout(layout)
-        dialog.exec_()
+        self._guide_dialog.show()
+        self._guide_dialog.raise_()
+        self._guide_dialog.activateWindow()
 
 def main():
     """Main entry point"""
@@ -841,9 +1109,10 @@ def main():
     app.setApplicationVersion("1.0.0")
     
     # Set application icon
-    icon_path = Path(__file__).parent / "assets" / "icons" / "warp_client.png"
-    if icon_path.exists():
-        app.setWindowIcon(QIcon(str(icon_path)))
+    # A missing or unreadable file yields a null icon; no separate existence check
+    icon = _app_icon()
+    if not icon.isNull():
+        app.setWindowIcon(icon)
     
     # Create and show main window
     window = WarpSuiteManager()
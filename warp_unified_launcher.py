@@ -6,30 +6,32 @@ Combines Mini WARP Client + WARP Data Manager for complete terminal management
 
 import sys
 import os
-import argparse
+import shlex
 import subprocess
 from pathlib import Path
 
 # Add src directory to path
 sys.path.append(str(Path(__file__).parent / 'src'))
 
-class WARPEcosystemLauncher:
-    def __init__(self):
-        self.base_dir = Path(__file__).parent
-        self.available_modes = {
-            'client-gui': 'Launch Mini WARP Client GUI',
-            'client-cli': 'Launch Mini WARP Client CLI', 
-            'backup-gui': 'Launch WARP Data Manager GUI',
-            'backup-cli': 'Launch WARP Data Manager CLI',
-            'manager': 'Launch Integrated Suite Manager',
-            'setup': 'Setup complete WARP ecosystem',
-            'backup-auto': 'Create automatic backup before launching client',
-            'restore': 'Restore WARP data from backup',
-            'dashboard': 'Launch unified dashboard'
-        }
-    
-    def show_banner(self):
-        print("""
+def _warp_running():
+    """True if any other process has 'warp' in its command line, None if unknown"""
+    own_pid = str(os.getpid())
+    try:
+        with os.scandir('/proc') as it:
+            for entry in it:
+                if not entry.name.isdigit() or entry.name == own_pid:
+                    continue
+                try:
+                    with open(f'/proc/{entry.name}/cmdline', 'rb') as f:
+                        if b'warp' in f.read():
+                            return True
+                except OSError:
+                    continue
+    except OSError:
+        return None
+    return False
+
+BANNER = """
 🚀 WARP Terminal Unified Ecosystem
 =====================================
 🎯 Complete WARP Terminal Management Solution
@@ -41,13 +43,47 @@ Components:
 ⚡ Automated Workflows   - Backup, restore, sync operations
 
 Professional Development Tools
-""")
+"""
+
+class WARPEcosystemLauncher:
+    AVAILABLE_MODES = {
+        'client-gui': 'Launch Mini WARP Client GUI',
+        'client-cli': 'Launch Mini WARP Client CLI', 
+        'backup-gui': 'Launch WARP Data Manager GUI',
+        'backup-cli': 'Launch WARP Data Manager CLI',
+        'manager': 'Launch Integrated Suite Manager',
+        'setup': 'Setup complete WARP ecosystem',
+        'backup-auto': 'Create automatic backup before launching client',
+        'restore': 'Restore WARP data from backup',
+        'dashboard': 'Launch unified dashboard'
+    }
+    
+    # Mode -> handler method name
+    MODE_HANDLERS = {
+        'client-gui': 'launch_client_gui',
+        'client-cli': 'launch_client_cli',
+        'backup-gui': 'launch_backup_gui',
+        'backup-cli': 'launch_backup_cli',
+        'manager': 'launch_unified_manager',
+        'setup': 'setup_ecosystem',
+        'backup-auto': 'auto_backup_and_launch',
+        'restore': 'launch_backup_gui',  # GUI is better for restore
+        'dashboard': 'launch_dashboard'
+    }
+    
+    def __init__(self):
+        self.base_dir = Path(__file__).parent
+    
+    def show_banner(self):
+        print(BANNER)
 
     def launch_client_gui(self):
         """Launch Mini WARP Client GUI"""
         print("🚀 Launching Mini WARP Client GUI...")
         try:
-            subprocess.run([sys.executable, str(self.base_dir / 'warp_suite_manager.py')])
+            # Detach the GUI so the launcher returns immediately
+            subprocess.Popen([sys.executable, str(self.base_dir / 'warp_suite_manager.py')],
+                             start_new_session=True)
         except Exception as e:
             print(f"❌ Failed to launch GUI: {e}")
             print("💡 Try: python warp_suite_manager.py")
@@ -65,7 +101,8 @@ Professional Development Tools
         """Launch WARP Data Manager GUI"""
         print("💾 Launching WARP Data Manager GUI...")
         try:
-            subprocess.run([sys.executable, str(self.base_dir / 'warp-manager.py')])
+            subprocess.Popen([sys.executable, str(self.base_dir / 'warp-manager.py')],
+                             start_new_session=True)
         except Exception as e:
             print(f"❌ Failed to launch backup GUI: {e}")
             print("💡 Try: python warp-manager.py")
@@ -87,8 +124,12 @@ Professional Development Tools
         elif choice == '2':
             print("Available components: rules, mcp, database, preferences, logs")
             components = input("Enter components (space-separated): ").strip()
-            cmd = [sys.executable, str(self.base_dir / 'warp-manager-enhanced.py'), '--backup'] + components.split()
-            subprocess.run(cmd)
+            try:
+                components = shlex.split(components)
+            except ValueError as e:
+                print(f"❌ Invalid component list: {e}")
+                return
+            subprocess.run([sys.executable, str(self.base_dir / 'warp-manager-enhanced.py'), '--backup', *components])
         elif choice == '3':
             subprocess.run([sys.executable, str(self.base_dir / 'warp-manager-enhanced.py'), '--list'])
         elif choice == '4':
@@ -115,8 +156,9 @@ Professional Development Tools
         print("💾 Creating automatic backup before launching client...")
         try:
             # Create snapshot backup
+            # Only the exit status is used, so don't buffer the output
             result = subprocess.run([sys.executable, str(self.base_dir / 'warp-manager-enhanced.py'), '--snapshot'], 
-                                  capture_output=True, text=True)
+                                  stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
             if result.returncode == 0:
                 print("✅ Backup created successfully")
                 print("🚀 Launching Mini WARP Client...")
@@ -136,7 +178,8 @@ Professional Development Tools
         # Install dependencies for both systems
         print("📦 Installing dependencies...")
         try:
-            subprocess.run([sys.executable, str(self.base_dir / 'deploy-fast.sh')], check=True)
+            # deploy-fast.sh is a bash script that uses paths relative to the repo
+            subprocess.run(['bash', str(self.base_dir / 'deploy-fast.sh')], cwd=self.base_dir, check=True)
             print("✅ WARP Data Manager dependencies installed")
         except:
             print("⚠️ Manual dependency installation may be required")
@@ -159,7 +202,7 @@ Professional Development Tools
         
         print("\n🎉 WARP Ecosystem setup complete!")
         print("📋 Available commands:")
-        for mode, desc in self.available_modes.items():
+        for mode, desc in self.AVAILABLE_MODES.items():
             print(f"  python warp_unified_launcher.py {mode}  # {desc}")
 
     def launch_dashboard(self):
@@ -169,26 +212,33 @@ Professional Development Tools
         
         # Show system status
         print("🔍 System Status:")
-        try:
-            # Check if WARP client processes are running
-            result = subprocess.run(['pgrep', '-f', 'warp'], capture_output=True, text=True)
-            if result.stdout.strip():
-                print("  ✅ WARP processes: Running")
-            else:
-                print("  ⭕ WARP processes: Not running")
-        except:
+        # Check if WARP client processes are running
+        running = _warp_running()
+        if running:
+            print("  ✅ WARP processes: Running")
+        elif running is None:
             print("  ❓ WARP processes: Unknown")
+        else:
+            print("  ⭕ WARP processes: Not running")
         
         # Check backup status
+        # One directory pass; DirEntry.stat() reuses data from the scan where possible
         backup_dir = Path.home() / '.warp-backups'
-        if backup_dir.exists():
-            backups = list(backup_dir.glob('*.tar.zst'))
-            print(f"  📦 Backups available: {len(backups)}")
-            if backups:
-                latest = max(backups, key=lambda x: x.stat().st_mtime)
-                print(f"  📅 Latest backup: {latest.name}")
-        else:
-            print("  📦 Backups available: 0")
+        latest_name, latest_mtime, count = None, -1, 0
+        try:
+            with os.scandir(backup_dir) as it:
+                for entry in it:
+                    if entry.name.endswith('.tar.zst') and entry.is_file(follow_symlinks=False):
+                        count += 1
+                        mtime = entry.stat(follow_symlinks=False).st_mtime
+                        if mtime > latest_mtime:
+                            latest_mtime, latest_name = mtime, entry.name
+        except OSError:
+            count = 0
+        
+        print(f"  📦 Backups available: {count}")
+        if latest_name:
+            print(f"  📅 Latest backup: {latest_name}")
         
         print("\n🚀 Quick Actions:")
         print("  1. Launch Client GUI")
@@ -207,8 +257,11 @@ Professional Development Tools
         elif choice == '4':
             self.launch_client_cli()
 
-def main():
-    launcher = WARPEcosystemLauncher()
+_MODE_SET = frozenset(WARPEcosystemLauncher.AVAILABLE_MODES)
+
+def parse_args():
+    """Full argparse parsing, only used for --banner, --help and invalid arguments"""
+    import argparse
     
     parser = argparse.ArgumentParser(
         description="WARP Terminal Unified Ecosystem Launcher",
@@ -232,45 +285,46 @@ Examples:
         """
     )
     
-    parser.add_argument('mode', nargs='?', choices=launcher.available_modes.keys(),
+    parser.add_argument('mode', nargs='?', choices=tuple(WARPEcosystemLauncher.AVAILABLE_MODES),
                        help='Launch mode')
     parser.add_argument('--banner', action='store_true', help='Show banner')
     
-    args = parser.parse_args()
+    return parser.parse_args()
+
+def main():
+    # Fast path: a single known mode (or none) needs no argparse
+    argv = sys.argv[1:]
+    if not argv:
+        mode, banner = None, False
+    elif len(argv) == 1 and argv[0] in _MODE_SET:
+        mode, banner = argv[0], False
+    else:
+        args = parse_args()
+        mode, banner = args.mode, args.banner
+    
+    launcher = WARPEcosystemLauncher()
     
-    if args.banner or not args.mode:
+    if banner or not mode:
         launcher.show_banner()
     
-    if not args.mode:
+    if not mode:
         print("Available modes:")
-        for mode, desc in launcher.available_modes.items():
+        for mode, desc in launcher.AVAILABLE_MODES.items():
             print(f"  {mode:<15} - {desc}")
         return
     
     # Route to appropriate launcher
-    mode_handlers = {
-        'client-gui': launcher.launch_client_gui,
-        'client-cli': launcher.launch_client_cli,
-        'backup-gui': launcher.launch_backup_gui,
-        'backup-cli': launcher.launch_backup_cli,
-        'manager': launcher.launch_unified_manager,
-        'setup': launcher.setup_ecosystem,
-        'backup-auto': launcher.auto_backup_and_launch,
-        'restore': launcher.launch_backup_gui,  # GUI is better for restore
-        'dashboard': launcher.launch_dashboard
-    }
-    
-    handler = mode_handlers.get(args.mode)
+    handler = launcher.MODE_HANDLERS.get(mode)
     if handler:
         try:
-            handler()
+            getattr(launcher, handler)()
         except KeyboardInterrupt:
             print("\n\n👋 Goodbye!")
         except Exception as e:
             print(f"\n❌ Error: {e}")
             sys.exit(1)
     else:
-        print(f"❌ Unknown mode: {args.mode}")
+        print(f"❌ Unknown mode: {mode}")
         sys.exit(1)
 
 if __name__ == "__main__":